@@ -32,19 +32,177 @@ In case the Elves get hungry and need extra snacks, they need to know which Elf
 Find the Elf carrying the most Calories. How many total Calories is that Elf carrying?
 """
 
-# Get input calories
-with open('input.txt', 'r') as f:
-    # Split input into list of lists - each list is a list of calories for each elf
-    elf_calories = f.read().split('\n\n')
+import argparse
+import heapq
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from pathlib import Path
 
-    # Calculate total calories for each elf
-    total_calories = [sum([int(c) for c in calories.split('\n')]) for calories in elf_calories]
+import numpy as np
 
-    # Sort total calories descending
-    total_calories.sort(reverse=True)
+sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-# Highest total calories by single elf
-print(total_calories[0])
+from aoc_utils.loader import MappedInput
 
-# Total calories by top 3 elves
-print(sum(total_calories[:3]))
\ No newline at end of file
+# Largest chunk a worker reads into memory at once
+CHUNK_SIZE = 1 << 26
+
+
+def elf_totals(lines):
+    # Lazily total each elf's calories from an iterable of lines (str or bytes)
+    total = None
+
+    for line in lines:
+        if line.strip():
+            total = (total or 0) + int(line)
+        elif total is not None:
+            yield total
+            total = None
+
+    if total is not None:
+        yield total
+
+
+def top_calories(lines, k):
+    # The k highest totals, descending, keeping only a k-sized heap in memory
+    return heapq.nlargest(k, elf_totals(lines))
+
+
+def elf_totals_array(buffer):
+    # Every elf's total at once: parse all calories in C, then split them into
+    # the runs of consecutive lines holding a number, which np.add.reduceat
+    # sums in one go. Any run of blank lines (or CRLF ones) separates elves
+    if isinstance(buffer, str):
+        buffer = buffer.encode()
+
+    raw = np.frombuffer(buffer, dtype=np.uint8)
+    is_digit = (raw >= ord('0')) & (raw <= ord('9'))
+    number_starts = np.flatnonzero(is_digit & ~np.r_[False, is_digit[:-1]])
+
+    if not len(number_starts):
+        return np.empty(0, dtype=np.int64)
+
+    calories = np.fromstring(buffer, dtype=np.int64, sep=' ')
+    if len(number_starts) != len(calories):
+        raise ValueError('expected one calorie count per line')
+
+    # Line of each number; an elf starts wherever a line was skipped
+    lines = np.searchsorted(np.flatnonzero(raw == ord('\n')), number_starts)
+    starts = np.flatnonzero(np.diff(lines, prepend=-2) > 1)
+
+    return np.add.reduceat(calories, starts)
+
+
+def top_totals(totals, k):
+    # np.partition moves the k highest to the end without a full sort
+    k = min(k, len(totals))
+    return np.sort(np.partition(totals, len(totals) - k)[len(totals) - k:])[::-1].tolist()
+
+
+def chunk_bounds(path, chunk_size=CHUNK_SIZE):
+    # Split the file into (start, stop) byte ranges of about chunk_size, each
+    # ending on a blank line (LF or CRLF) so that no elf is cut in two
+    bounds = []
+
+    with MappedInput(path) as puzzle:
+        start, size, separator = 0, len(puzzle), puzzle.blank_line
+
+        while start < size:
+            stop = puzzle.find(separator, start + chunk_size)
+            stop = size if stop == -1 else stop + len(separator)
+
+            bounds.append((start, stop))
+            start = stop
+
+    return bounds
+
+
+def chunk_top_calories(path, start, stop, k):
+    with open(path, 'rb') as f:
+        f.seek(start)
+        return top_totals(elf_totals_array(f.read(stop - start)), k)
+
+
+def parallel_top_calories(path, k, jobs=None, chunk_size=None):
+    # Local top K per chunk in worker processes, merged into the global top K
+    jobs = jobs or os.cpu_count()
+
+    if chunk_size is None:
+        # A few chunks per worker keeps them all busy until the end
+        chunk_size = min(CHUNK_SIZE, os.path.getsize(path) // (jobs * 4) + 1)
+
+    tasks = [(path, start, stop, k) for start, stop in chunk_bounds(path, chunk_size)]
+
+    if jobs == 1:
+        tops = [chunk_top_calories(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            tops = list(executor.map(chunk_top_calories, *zip(*tasks)))
+
+    return heapq.nlargest(k, chain.from_iterable(tops))
+
+
+def benchmark(path, k):
+    # Throughput of the parallel reducer for doubling worker counts
+    size = os.path.getsize(path)
+    jobs = 1
+
+    while True:
+        start = time.perf_counter()
+        parallel_top_calories(path, k, jobs)
+        elapsed = time.perf_counter() - start
+
+        print(f'{jobs:>4} jobs {elapsed:>8.3f}s {size / elapsed / 1e6:>10.1f} MB/s')
+
+        if jobs >= os.cpu_count():
+            break
+        jobs = min(jobs * 2, os.cpu_count())
+
+
+def part1(data):
+    # Highest total calories by single elf
+    return top_totals(elf_totals_array(data), 1)[0]
+
+
+def part2(data):
+    # Total calories by top 3 elves
+    return sum(top_totals(elf_totals_array(data), 3))
+
+
+def solve(data):
+    return part1(data), part2(data)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('file', nargs='?', help='inventory to stream, or - for stdin')
+    parser.add_argument('-k', type=int, default=3, help='number of top totals')
+    parser.add_argument('-j', '--jobs', type=int, help='reduce chunks in this many processes')
+    parser.add_argument('--bench', action='store_true', help='report MB/s for each core count')
+    args = parser.parse_args()
+
+    if (args.bench or args.jobs) and args.file in (None, '-'):
+        parser.error('--bench and --jobs need an inventory file')
+
+    if args.bench:
+        benchmark(args.file, args.k)
+    elif args.file == '-':
+        print(top_calories(sys.stdin.buffer, args.k))
+    elif args.file and args.jobs:
+        print(parallel_top_calories(args.file, args.k, args.jobs))
+    elif args.file:
+        with open(args.file, 'rb') as f:
+            print(top_calories(f, args.k))
+    else:
+        # Get input calories
+        with open('input.txt', 'r') as f:
+            data = f.read()
+
+        # Part 1
+        print(part1(data))
+
+        # Part 2
+        print(part2(data))
@@ -239,30 +239,35 @@ class CRT:
         for row in range(0, len(self.pixels), 40):
             print(self.pixels[row:row+40])
 
+    def __str__(self):
+        return "\n".join(
+            self.pixels[row:row+40] for row in range(0, len(self.pixels), 40)
+        )
 
-with open("input.txt") as f:
-    instructions = f.read().splitlines()
 
-x = 1
-cycles = 0
+def part1(data):
+    instructions = data.splitlines()
 
-signal_strengths = []
+    x = 1
+    cycles = 0
 
-for instruction in instructions:
-    if instruction == "noop":
-        cycles += 1
-        if cycles in [20, 60, 100, 140, 180, 220]:
-            signal_strengths.append(cycles * x)
-        continue
-    else:
-        for _ in range(2):
+    signal_strengths = []
+
+    for instruction in instructions:
+        if instruction == "noop":
             cycles += 1
             if cycles in [20, 60, 100, 140, 180, 220]:
                 signal_strengths.append(cycles * x)
-        x += int(instruction.split()[1])
+            continue
+        else:
+            for _ in range(2):
+                cycles += 1
+                if cycles in [20, 60, 100, 140, 180, 220]:
+                    signal_strengths.append(cycles * x)
+            x += int(instruction.split()[1])
+
+    return sum(signal_strengths)
 
-# Part 1
-print(sum(signal_strengths))
 
 """
 It seems like the X register controls the horizontal position of a sprite. Specifically, the sprite is 3 pixels wide, and the X register sets the horizontal position of the middle of that sprite. (In this system, there is no such thing as "vertical position": if the sprite's horizontal position puts its pixels where the CRT is currently drawing, then those pixels will be drawn.)
@@ -388,14 +393,30 @@ Allowing the program to run to completion causes the CRT to produce the followin
 Render the image given by your program. What eight capital letters appear on your CRT?
 """
 
-cpu = CPU()
 
-pixels = ""
+def part2(data):
+    cpu = CPU()
+
+    pixels = ""
+
+    for instruction in data.splitlines():
+        pixels += cpu.execute(instruction)
+
+    crt = CRT(pixels)
+
+    return str(crt)
+
+
+def solve(data):
+    return part1(data), part2(data)
+
 
-for instruction in instructions:
-    pixels += cpu.execute(instruction)
+if __name__ == "__main__":
+    with open("input.txt") as f:
+        data = f.read()
 
-crt = CRT(pixels)
+    # Part 1
+    print(part1(data))
 
-# Part 2
-crt.show()
\ No newline at end of file
+    # Part 2
+    print(part2(data))
@@ -214,8 +214,6 @@ Figure out which monkeys to chase by counting how many items they inspect over 2
 
 import re
 
-lcd = 1
-
 
 class Monkey:
     def __init__(self, id, starting_items, operation, test, is_part_1):
@@ -227,6 +225,7 @@ class Monkey:
         self.is_part_1 = is_part_1
 
         self.items_inspected = 0
+        self.lcd = 1
 
     def __set_id(self, id):
         self.id = int(re.findall(r"\d+", id)[0])
@@ -264,7 +263,7 @@ class Monkey:
         )
 
     def add_item(self, item):
-        self.items.append(item % lcd)
+        self.items.append(item % self.lcd)
 
     def inspect(self, item):
         self.items_inspected += 1
@@ -292,30 +291,39 @@ class Monkey:
         return f"Monkey {self.id}, Items: {self.items}"
 
 
-with open("input.txt") as f:
-    lines = f.read().splitlines()
+def monkey_business(data, rounds, is_part_1):
+    lines = data.splitlines()
 
-monkeys = []
+    monkeys = []
 
-for i in range(0, len(lines), 7):
-    monkeys.append(
-        Monkey(lines[i], lines[i + 1], lines[i + 2], lines[i + 3 : i + 6], True)
-    )
+    for i in range(0, len(lines), 7):
+        monkeys.append(
+            Monkey(lines[i], lines[i + 1], lines[i + 2], lines[i + 3 : i + 6], is_part_1)
+        )
 
-for monkey in monkeys:
-    lcd *= monkey.divisible
+    lcd = 1
 
-for _ in range(20):
     for monkey in monkeys:
-        for monkey_throw_to, item in monkey.round():
-            monkeys[monkey_throw_to].add_item(item)
+        lcd *= monkey.divisible
+
+    for monkey in monkeys:
+        monkey.lcd = lcd
+
+    for _ in range(rounds):
+        for monkey in monkeys:
+            for monkey_throw_to, item in monkey.round():
+                monkeys[monkey_throw_to].add_item(item)
 
-        # print(monkey)
+            # print(monkey)
 
-monkeys = sorted(monkeys, key=lambda monkey: monkey.items_inspected, reverse=True)
+    monkeys = sorted(monkeys, key=lambda monkey: monkey.items_inspected, reverse=True)
+
+    return monkeys[0].items_inspected * monkeys[1].items_inspected
+
+
+def part1(data):
+    return monkey_business(data, 20, True)
 
-# Part 1
-print(monkeys[0].items_inspected * monkeys[1].items_inspected)
 
 """
 You're worried you might not ever get your items back. So worried, in fact, that your relief that a monkey's inspection didn't damage an item no longer causes your worry level to be divided by three.
@@ -402,24 +410,21 @@ After 10000 rounds, the two most active monkeys inspected items 52166 and 52013
 Worry levels are no longer divided by three after each item is inspected; you'll need to find another way to keep your worry levels manageable. Starting again from the initial state in your puzzle input, what is the level of monkey business after 10000 rounds?
 """
 
-monkeys = []
 
-for i in range(0, len(lines), 7):
-    monkeys.append(
-        Monkey(lines[i], lines[i + 1], lines[i + 2], lines[i + 3 : i + 6], False)
-    )
+def part2(data):
+    return monkey_business(data, 10000, False)
 
-for monkey in monkeys:
-    lcd *= monkey.divisible
 
-for _ in range(10000):
-    for monkey in monkeys:
-        for monkey_throw_to, item in monkey.round():
-            monkeys[monkey_throw_to].add_item(item)
+def solve(data):
+    return part1(data), part2(data)
+
 
-        # print(monkey)
+if __name__ == "__main__":
+    with open("input.txt") as f:
+        data = f.read()
 
-monkeys = sorted(monkeys, key=lambda monkey: monkey.items_inspected, reverse=True)
+    # Part 1
+    print(part1(data))
 
-# Part 2
-print(monkeys[0].items_inspected * monkeys[1].items_inspected)
+    # Part 2
+    print(part2(data))
@@ -28,120 +28,37 @@ This path reaches the goal in 31 steps, the fewest possible.
 What is the fewest steps required to move from your current position to the location that should get the best signal?
 """
 
-import math
+import sys
+from pathlib import Path
 
-with open("input.txt") as f:
-    data = f.read().splitlines()
+sys.path.append(str(Path(__file__).resolve().parents[1]))
 
+from aoc_utils.graph import bfs, grid_graph
+from aoc_utils.grid import Grid
 
-class Node:
+ELEVATION = {chr(i): i - ord("a") + 1 for i in range(ord("a"), ord("z") + 1)}
+ELEVATION.update(S=1, E=26)
 
-    convert_elevation = {
-        chr(i): i - ord("a") + 1 for i in range(ord("a"), ord("z") + 1)
-    }
 
-    def __init__(self, elevation):
+def can_climb(current, neighbor):
+    # Squares at elevation a are never stepped onto
+    return (neighbor - current <= 1) & (neighbor != 1)
 
-        self.char = elevation
-        self.__set_elevation(elevation)
-        self.neighbors = []
 
-    def add_neighbor(self, node):
-        self.neighbors.append(node)
+def build_graph(data):
+    grid = Grid.from_text(data, mapping=ELEVATION)
+    width = data.index("\n") + 1
 
-    def __set_elevation(self, elevation):
+    start_node = grid.index(*divmod(data.index("S"), width))
+    end_node = grid.index(*divmod(data.index("E"), width))
 
-        if elevation == "S":
-            self.elevation = 1
-        elif elevation == "E":
-            self.elevation = 26
-        else:
-            self.elevation = self.convert_elevation[elevation]
+    return grid, grid_graph(grid, can_climb), start_node, end_node
 
-    def __str__(self):
-        return f"Node with elevation: {self.elevation}"
 
+def part1(data):
+    _, g, start_node, end_node = build_graph(data)
+    return int(bfs(g, start_node, target=end_node).distance[end_node])
 
-class Graph:
-    def __init__(self):
-
-        self.nodes = []
-
-    def from_map(self, map):
-
-        for i, row in enumerate(map):
-            for j, node in enumerate(row):
-                self.nodes.append(node)
-
-                if i > 0:
-                    node.add_neighbor(map[i - 1][j])
-                    map[i - 1][j].add_neighbor(node)
-                if j > 0:
-                    node.add_neighbor(map[i][j - 1])
-                    map[i][j - 1].add_neighbor(node)
-                if i < len(map) - 1:
-                    node.add_neighbor(map[i + 1][j])
-                    map[i + 1][j].add_neighbor(node)
-                if j < len(row) - 1:
-                    node.add_neighbor(map[i][j + 1])
-                    map[i][j + 1].add_neighbor(node)
-
-    def bfs(self, start: Node, end: Node):
-
-        queue = [start]
-        visited = set()
-        visited.add(start)
-        path = {start: None}
-
-        while queue:
-            current = queue.pop(0)
-            if current == end:
-                break
-            for neighbor in current.neighbors:
-                if (
-                    neighbor not in visited
-                    and neighbor.elevation - current.elevation <= 1
-                    and neighbor.elevation != 1
-                ):
-                    visited.add(neighbor)
-                    queue.append(neighbor)
-                    path[neighbor] = current
-
-        current = end
-        path_list = [current]
-        while current != start:
-            if current not in path:
-                return math.inf
-            current = path[current]
-            path_list.append(current)
-
-        return len(path_list) - 1
-
-    def __str__(self):
-        return f"Nodes: {len(self.nodes)}"
-
-
-map = []
-start_node = None
-end_node = None
-
-for line in data:
-    map.append([])
-    for char in line:
-        map[-1].append(Node(char))
-
-        if char == "S":
-            start_node = map[-1][-1]
-        elif char == "E":
-            end_node = map[-1][-1]
-
-g = Graph()
-g.from_map(map)
-
-path = g.bfs(start_node, end_node)
-
-# Part 1
-print(path)
 
 """
 As you walk up the hill, you suspect that the Elves will want to turn this into a hiking trail. The beginning isn't very scenic, though; perhaps you can find a better starting point.
@@ -167,14 +84,25 @@ This path reaches the goal in only 29 steps, the fewest possible.
 What is the fewest steps required to move starting from any square with elevation a to the location that should get the best signal?
 """
 
-possible_starts = [node for node in g.nodes if node.elevation == 1]
 
-shortest_path = math.inf
+def part2(data):
+    grid, g, _, end_node = build_graph(data)
+
+    # Search from every square at elevation a at once
+    possible_starts = grid.indices()[grid.cells.ravel() == 1]
+    return int(bfs(g, possible_starts, target=end_node).distance[end_node])
+
+
+def solve(data):
+    return part1(data), part2(data)
+
+
+if __name__ == "__main__":
+    with open("input.txt") as f:
+        data = f.read()
 
-for possible_start in possible_starts:
-    path = g.bfs(possible_start, end_node)
-    if path < shortest_path:
-        shortest_path = path
+    # Part 1
+    print(part1(data))
 
-# Part 2
-print(shortest_path)
+    # Part 2
+    print(part2(data))
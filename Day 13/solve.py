@@ -111,13 +111,16 @@ Determine which pairs of packets are already in the right order. What is the sum
 import ast
 from functools import cmp_to_key
 
-data = []
 
-with open("input.txt") as f:
-    for line in f:
+def parse_input(data):
+    packets = []
+
+    for line in data.splitlines():
         line = line.strip()
         if line:
-            data.append(ast.literal_eval(line))
+            packets.append(ast.literal_eval(line))
+
+    return packets
 
 
 def compare(left, right):
@@ -150,15 +153,17 @@ def compare(left, right):
     return compare(left, right)
 
 
-indices = []
+def part1(data):
+    packets = parse_input(data)
+
+    indices = []
 
-for index, (first, second) in enumerate(zip(data[::2], data[1::2])):
-    if compare(first, second) == 1:
-        indices.append(index + 1)
+    for index, (first, second) in enumerate(zip(packets[::2], packets[1::2])):
+        if compare(first, second) == 1:
+            indices.append(index + 1)
 
+    return sum(indices)
 
-# Part 1
-print(sum(indices))
 
 """
 Now, you just need to put all of the packets in the right order. Disregard the blank lines in your list of received packets.
@@ -194,12 +199,30 @@ Afterward, locate the divider packets. To find the decoder key for this distress
 Organize all of the packets into the correct order. What is the decoder key for the distress signal?
 """
 
-data.append([2])
-data.append([6])
 
-sorted_packets = sorted(data, key=cmp_to_key(compare), reverse=True)
-first_divider_index = sorted_packets.index([2]) + 1
-second_divider_index = sorted_packets.index([6]) + 1
+def part2(data):
+    packets = parse_input(data)
+
+    packets.append([2])
+    packets.append([6])
+
+    sorted_packets = sorted(packets, key=cmp_to_key(compare), reverse=True)
+    first_divider_index = sorted_packets.index([2]) + 1
+    second_divider_index = sorted_packets.index([6]) + 1
+
+    return first_divider_index * second_divider_index
+
+
+def solve(data):
+    return part1(data), part2(data)
+
+
+if __name__ == "__main__":
+    with open("input.txt") as f:
+        data = f.read()
+
+    # Part 1
+    print(part1(data))
 
-# Part 2
-print(first_divider_index * second_divider_index)
+    # Part 2
+    print(part2(data))
@@ -112,15 +112,25 @@ Once all 24 units of sand shown above have come to rest, all further sand flows
 ~..........
 Using your scan, simulate the falling sand. How many units of sand come to rest before sand starts flowing into the abyss below?
 """
-import math
 import re
+import sys
+from pathlib import Path
 
 import numpy as np
 
-rock_lines = []
+sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-with open("input.txt", "r") as f:
-    for line in f:
+from aoc_utils.grid import Grid
+
+AIR, ROCK, SAND = 0, 1, 2
+
+SOURCE = (500, 0)
+
+
+def parse_input(data):
+    rock_lines = []
+
+    for line in data.splitlines():
         rocks = re.findall(r"\d+", line)
         rocks = [int(x) for x in rocks]
 
@@ -133,6 +143,8 @@ with open("input.txt", "r") as f:
             ]
         )
 
+    return rock_lines
+
 
 class Cave:
     def __init__(self, rocks, part_1):
@@ -140,94 +152,71 @@ class Cave:
         self.part_1 = part_1
         self.__set_cave(rocks)
 
-    def sand_fall(self, sand_position):
-
-        x, y = sand_position
-
-        while True:
-
-            if y == self.max_y:
-                return True
-
-            if self.cave_map[x, y + 1] == 0:
-                y += 1
-            elif self.cave_map[x - 1, y + 1] == 0:
-                x -= 1
-                y += 1
-            elif self.cave_map[x + 1, y + 1] == 0:
-                x += 1
-                y += 1
-            else:
-                break
-
-        if (x, y) != sand_position and y < self.max_y:
-            if self.cave_map[x, y] == 2:
-                return True
-            self.cave_map[x, y] = 2
-
-        return (x, y) == sand_position
+        # Sand tries straight down first, then down-left, then down-right
+        self.steps = [self.grid.offsets[name] for name in ("down", "down-left", "down-right")]
 
     def simulate_sand(self):
-
-        sand_position = (500, 0)
-
-        while True:
-            done = self.sand_fall(sand_position)
-            if done:
-                break
+        # Every grain follows the path of the one before it until that one
+        # came to rest, so the walk resumes from the previous grain's last
+        # free cell instead of starting over at the source
+        flat, inside = self.grid.flat, self.grid.inside
+        path = [self.grid.index(SOURCE[1], SOURCE[0] - self.min_x)]
+
+        while path:
+            position = path[-1]
+
+            for step in self.steps:
+                below = position + step
+                if flat[below] == AIR:
+                    # Air in the padding is the abyss under the lowest rock
+                    if not inside[below]:
+                        return
+                    path.append(below)
+                    break
+            else:
+                flat[position] = SAND
+                path.pop()
 
     def sand_count(self):
-        return np.sum(self.cave_map == 2)
+        return int(np.count_nonzero(self.grid.cells == SAND))
 
     def __set_cave(self, rocks):
 
-        min_x = math.inf
-        max_x, max_y = -math.inf, -math.inf
+        max_y = max(max(rock_1[1], rock_2[1]) for rock_1, rock_2 in rocks)
+        floor = max_y + 2
 
-        for rock_1, rock_2 in rocks:
-            min_x = min(min_x, rock_1[0], rock_2[0])
-            max_x = max(max_x, rock_1[0], rock_2[0])
-            max_y = max(max_y, rock_1[1], rock_2[1])
+        # Sand spreads at most one column per row, so a cone around the
+        # source is all the width either part needs
+        xs = [rock[0] for rock_line in rocks for rock in rock_line]
+        self.min_x = min(SOURCE[0] - floor, *xs)
+        max_x = max(SOURCE[0] + floor, *xs)
 
-        self.min_x = min_x - 50000
-        self.max_x = max_x + 50000
-        self.max_y = max_y if self.part_1 else max_y + 2
-        self.cave_map = np.zeros((self.max_x + 2, self.max_y + 1), dtype=int)
+        # Rows are y and columns x. Part 1 stops at the lowest rock, with the
+        # abyss in the padding below it; part 2 adds the floor
+        cave_map = np.full((max_y + 1 if self.part_1 else floor + 1, max_x - self.min_x + 1), AIR, dtype=np.int8)
 
-        for rock1, rock_2 in rocks:
+        for rock_1, rock_2 in rocks:
 
-            left_x, right_x = min(rock1[0], rock_2[0]), max(rock1[0], rock_2[0])
-            left_y, right_y = min(rock1[1], rock_2[1]), max(rock1[1], rock_2[1])
+            left_x, right_x = min(rock_1[0], rock_2[0]), max(rock_1[0], rock_2[0])
+            left_y, right_y = min(rock_1[1], rock_2[1]), max(rock_1[1], rock_2[1])
 
-            self.cave_map[left_x : right_x + 1, left_y : right_y + 1] = 1
+            cave_map[left_y : right_y + 1, left_x - self.min_x : right_x - self.min_x + 1] = ROCK
 
         if not self.part_1:
-            self.cave_map[:, -1] = 1
+            cave_map[floor] = ROCK
 
-    def __str__(self):
-        first_sand = self.min_x
-        last_sand = self.max_x
+        self.grid = Grid(cave_map, fill=AIR)
 
-        return_str = ""
-
-        for i in self.cave_map[first_sand - 1 : last_sand + 1].T:
-            for j in i:
-                if j == 0:
-                    return_str += "."
-                elif j == 1:
-                    return_str += "#"
-                elif j == 2:
-                    return_str += "o"
-            return_str += "\n"
-
-        return return_str
+    def __str__(self):
+        symbols = np.array([".", "#", "o"])
+        return "\n".join("".join(row) for row in symbols[self.grid.cells]) + "\n"
 
 
-cave = Cave(rock_lines, part_1=True)
-cave.simulate_sand()
+def part1(data):
+    cave = Cave(parse_input(data), part_1=True)
+    cave.simulate_sand()
 
-# Part 1
-print(cave.sand_count())
+    return cave.sand_count()
 
 """
 You realize you misread the scan. There isn't an endless void at the bottom of the scan - there's floor, and you're standing on it!
@@ -265,8 +254,24 @@ To find somewhere safe to stand, you'll need to simulate falling sand until a un
 Using your scan, simulate the falling sand until the source of the sand becomes blocked. How many units of sand come to rest?
 """
 
-cave = Cave(rock_lines, part_1=False)
-cave.simulate_sand()
 
-# Part 1
-print(cave.sand_count() + 1)
+def part2(data):
+    cave = Cave(parse_input(data), part_1=False)
+    cave.simulate_sand()
+
+    return cave.sand_count()
+
+
+def solve(data):
+    return part1(data), part2(data)
+
+
+if __name__ == "__main__":
+    with open("input.txt", "r") as f:
+        data = f.read()
+
+    # Part 1
+    print(part1(data))
+
+    # Part 2
+    print(part2(data))
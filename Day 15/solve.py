@@ -94,13 +94,17 @@ In this example, in the row where y=10, there are 26 positions where a beacon ca
 
 Consult the report from the sensors you just deployed. In the row where y=2000000, how many positions cannot contain a beacon?
 """
-from re import findall
+import sys
+from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-def read_file(filename: str = "input.txt") -> list:
-    pattern = "Sensor at x=(.+), y=(.+): closest beacon is at x=(.+), y=(.*)"
-    with open(f"{filename}", "r") as f:
-        return [[int(x) for x in findall(pattern, line)[0]] for line in f.readlines()]
+from aoc_utils.utils import int_rows
+
+
+def parse_input(data: str) -> list:
+    # One (sx, sy, bx, by) row per sensor
+    return int_rows(data, 4).tolist()
 
 
 def combine_ranges(ranges: list) -> list:
@@ -132,15 +136,11 @@ def get_blocked_ranges(
     return combine_ranges(sorted(ranges))
 
 
-def part1(vals: list, test: bool = False) -> int:
+def part1(data: str, test: bool = False) -> int:
+    vals = parse_input(data)
     return sum(len(r) for r in get_blocked_ranges(vals, 10 if test else 2000000))
 
 
-vals = read_file()
-
-# Part 1
-print(f"{part1(vals)}")
-
 """
 Your handheld device indicates that the distress signal is coming from a beacon nearby. The distress beacon is not detected by any sensor, but the distress beacon must have x and y coordinates each no lower than 0 and no larger than 4000000.
 
@@ -152,7 +152,8 @@ Find the only possible position for the distress beacon. What is its tuning freq
 """
 
 
-def part2(vals: list, test: bool = False) -> int:
+def part2(data: str, test: bool = False) -> int:
+    vals = parse_input(data)
     max_val = 20 if test else 4000000
     for i in range(max_val + 1):
         ranges = get_blocked_ranges(vals, i, 0, max_val)
@@ -160,5 +161,16 @@ def part2(vals: list, test: bool = False) -> int:
             return (ranges[0].stop + 1) * 4000000 + i
 
 
-# Part 2
-print(f"{part2(vals)}")
+def solve(data: str) -> tuple:
+    return part1(data), part2(data)
+
+
+if __name__ == "__main__":
+    with open("input.txt", "r") as f:
+        data = f.read()
+
+    # Part 1
+    print(f"{part1(data)}")
+
+    # Part 2
+    print(f"{part2(data)}")
@@ -9,22 +9,26 @@ from functools import cache
 
 REGEX = r"^Valve (\w+) has flow rate=(\d+); tunnels? leads? to valves? ([\w ,]+)$"
 
-valves = {}
-dist = defaultdict(lambda: defaultdict(lambda: math.inf))
 
-for i, flow_rate, tunnels in re.findall(REGEX, open("input.txt").read(), re.MULTILINE):
-    valves[i] = int(flow_rate)
-    dist[i][i] = 0
-    for j in tunnels.split(", "):
-        dist[i][j] = 1
+def parse_input(data: str):
+    valves = {}
+    dist = defaultdict(lambda: defaultdict(lambda: math.inf))
 
-for k in valves:
-    for i in valves:
-        for j in valves:
-            dist[i][j] = min(dist[i][j], dist[i][k] + dist[k][j])
+    for i, flow_rate, tunnels in re.findall(REGEX, data, re.MULTILINE):
+        valves[i] = int(flow_rate)
+        dist[i][i] = 0
+        for j in tunnels.split(", "):
+            dist[i][j] = 1
 
+    for k in valves:
+        for i in valves:
+            for j in valves:
+                dist[i][j] = min(dist[i][j], dist[i][k] + dist[k][j])
 
-def calculate_max_flow(minutes: int, part_2: bool):
+    return valves, dist
+
+
+def calculate_max_flow(valves: dict, dist: dict, minutes: int, part_2: bool):
     @cache
     def dp(i: str, t: int, remaining: frozenset, elephant: bool):
         ans = dp("AA", minutes, remaining, False) if elephant else 0
@@ -38,8 +42,9 @@ def calculate_max_flow(minutes: int, part_2: bool):
     return dp("AA", minutes, frozenset(x for x in valves if valves[x] > 0), part_2)
 
 
-# Part 1
-print(calculate_max_flow(30, False))
+def part1(data: str):
+    return calculate_max_flow(*parse_input(data), 30, False)
+
 
 """
 You're worried that even with an optimal approach, the pressure released won't be enough. What if you got one of the elephants to help you?
@@ -120,5 +125,21 @@ With the elephant helping, after 26 minutes, the best you could do would release
 With you and an elephant working together for 26 minutes, what is the most pressure you could release?
 """
 
-# Part 2
-print(calculate_max_flow(26, True))
+
+def part2(data: str):
+    return calculate_max_flow(*parse_input(data), 26, True)
+
+
+def solve(data: str):
+    return part1(data), part2(data)
+
+
+if __name__ == "__main__":
+    with open("input.txt") as f:
+        data = f.read()
+
+    # Part 1
+    print(part1(data))
+
+    # Part 2
+    print(part2(data))
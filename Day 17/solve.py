@@ -1,116 +1,143 @@
 import sys
+from pathlib import Path
 
-infile = sys.argv[1] if len(sys.argv) > 1 else "input.txt"
-data = open(infile).read().strip()
-lines = [x for x in data.split("\n")]
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from aoc_utils.grid import Grid
 
 # The tall, vertical chamber is exactly seven units wide. Each rock appears so that its left edge is two units away from the left wall and its bottom edge is three units above the highest rock in the room (or the floor, if there isn't one).
 
+WIDTH = 7
+AIR, ROCK = 0, 1
+
+# (x, height above the bottom edge) of every cell of each piece, in order
+PIECES = [
+    [(2, 0), (3, 0), (4, 0), (5, 0)],
+    [(3, 2), (2, 1), (3, 1), (4, 1), (3, 0)],
+    [(2, 0), (3, 0), (4, 0), (4, 1), (4, 2)],
+    [(2, 0), (2, 1), (2, 2), (2, 3)],
+    [(2, 1), (2, 0), (3, 1), (3, 0)],
+]
+
+# Rows below the top rock compared to spot a cycle
+SIGNATURE_ROWS = 30
+
+
+class Chamber:
+    """
+    The chamber as a ``Grid`` whose row ``y - 1`` holds height ``y``. The
+    padding is rock, so the walls and the floor need no bounds checks, and a
+    piece is a list of flat offsets moved by adding a step to its position.
+    """
+
+    def __init__(self, rows=1024):
+        self.grid = Grid(np.zeros((rows, WIDTH), dtype=np.uint8), fill=ROCK)
+        self.top = 0
+
+        # Rows count up from the floor, so a piece falls towards lower rows.
+        # Pieces are anchored at their leftmost column, which keeps the
+        # anchor inside the chamber
+        stride = self.grid.stride
+        self.fall = -stride
+        self.pieces = [[x - 2 + y * stride for x, y in piece] for piece in PIECES]
+        self.heights = [max(y for _, y in piece) + 1 for piece in PIECES]
+
+    def grow(self):
+        # The same stride and padding keep every flat index valid
+        cells = self.grid.cells
+        self.grid = Grid(np.concatenate([cells, np.zeros_like(cells)]), fill=ROCK)
+
+    def fits(self, piece, position):
+        flat = self.grid.flat
+        return all(flat[position + cell] == AIR for cell in piece)
+
+    def drop(self, kind, jets, i):
+        # Push and drop a piece until it rests; returns the next jet index
+        if self.top + 8 > self.grid.height:
+            self.grow()
+
+        piece = self.pieces[kind]
+        position = self.grid.index(self.top + 3, 2)
+
+        while True:
+            push = -1 if jets[i] == "<" else 1
+            i = (i + 1) % len(jets)
+
+            if self.fits(piece, position + push):
+                position += push
+
+            if not self.fits(piece, position + self.fall):
+                break
+            position += self.fall
+
+        flat = self.grid.flat
+        for cell in piece:
+            flat[position + cell] = ROCK
+
+        row, _ = self.grid.position(position)
+        self.top = max(self.top, row + self.heights[kind])
+
+        return i
+
+    def signature(self):
+        # The top rows of the padded buffer, including the floor while it is
+        # still in reach
+        return self.grid.padded[max(self.top - SIGNATURE_ROWS, 0) : self.top + 1].tobytes()
+
+    def __str__(self):
+        return "\n".join(
+            "".join("#" if cell else " " for cell in row) for row in self.grid.cells[self.top - 1 :: -1]
+        )
+
+
+def simulate(data, L):
+    data = data.strip()
+
+    chamber = Chamber()
+
+    SEEN = {}
+    i = 0
+    t = 0
+    added = 0
+    while t < L:
+        i = chamber.drop(t % 5, data, i)
+        top = chamber.top
+
+        SR = (i, t % 5, chamber.signature())
+        if SR in SEEN and t >= 2022:
+            (oldt, oldy) = SEEN[SR]
+            dy = top - oldy
+            dt = t - oldt
+            amt = (L - t) // dt
+            added += amt * dy
+            t += amt * dt
+            assert t <= L
+        SEEN[SR] = (t, top)
+        t += 1
+
+    return top + added
+
+
+def part1(data):
+    return simulate(data, 2022)
+
+
+def part2(data):
+    return simulate(data, 1000000000000)
+
+
+def solve(data):
+    return part1(data), part2(data)
+
+
+if __name__ == "__main__":
+    infile = sys.argv[1] if len(sys.argv) > 1 else "input.txt"
+    data = open(infile).read()
+
+    # Part 1
+    print(part1(data))
 
-def get_piece(t, y):  # set of (x,y) pairs
-    A = set()
-    if t == 0:
-        return set([(2, y), (3, y), (4, y), (5, y)])
-    elif t == 1:
-        return set([(3, y + 2), (2, y + 1), (3, y + 1), (4, y + 1), (3, y)])
-    elif t == 2:
-        return set([(2, y), (3, y), (4, y), (4, y + 1), (4, y + 2)])
-    elif t == 3:
-        return set([(2, y), (2, y + 1), (2, y + 2), (2, y + 3)])
-    elif t == 4:
-        return set([(2, y + 1), (2, y), (3, y + 1), (3, y)])
-    else:
-        assert False
-
-
-def move_left(piece):
-    if any([x == 0 for (x, y) in piece]):
-        return piece
-    return set([(x - 1, y) for (x, y) in piece])
-
-
-def move_right(piece):
-    if any([x == 6 for (x, y) in piece]):
-        return piece
-    return set([(x + 1, y) for (x, y) in piece])
-
-
-def move_down(piece):
-    return set([(x, y - 1) for (x, y) in piece])
-
-
-def move_up(piece):
-    return set([(x, y + 1) for (x, y) in piece])
-
-
-def show(R):
-    maxY = max([y for (x, y) in R])
-    for y in range(maxY, 0, -1):
-        row = ""
-        for x in range(7):
-            if (x, y) in R:
-                row += "#"
-            else:
-                row += " "
-        print(row)
-
-
-R = set([(x, 0) for x in range(7)])
-
-
-def signature(R):
-    maxY = max([y for (x, y) in R])
-    return frozenset([(x, maxY - y) for (x, y) in R if maxY - y <= 30])
-
-
-L = 1000000000000
-
-SEEN = {}
-part_1 = 0
-top = 0
-i = 0
-t = 0
-added = 0
-while t < L:
-    # print(t, len(SEEN))
-    piece = get_piece(t % 5, top + 4)
-    while True:
-        # pushed -> down
-        if data[i] == "<":
-            piece = move_left(piece)
-            if piece & R:
-                piece = move_right(piece)
-        else:
-            piece = move_right(piece)
-            if piece & R:
-                piece = move_left(piece)
-        i = (i + 1) % len(data)
-        piece = move_down(piece)
-        if piece & R:
-            piece = move_up(piece)
-            R |= piece
-            top = max([y for (x, y) in R])
-
-            SR = (i, t % 5, signature(R))
-            if SR in SEEN and t >= 2022:
-                (oldt, oldy) = SEEN[SR]
-                dy = top - oldy
-                dt = t - oldt
-                amt = (L - t) // dt
-                added += amt * dy
-                t += amt * dt
-                assert t <= L
-            SEEN[SR] = (t, top)
-            # show(R)
-            break
-    t += 1
-    if t == 2022:
-        part_1 = top
-
-
-# Part 1
-print(part_1)
-
-
-# Part 2
-print(top + added)
+    # Part 2
+    print(part2(data))
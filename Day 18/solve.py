@@ -29,77 +29,56 @@ In the above example, after counting up all the sides that aren't connected to a
 What is the surface area of your scanned lava droplet?
 """
 
-import re
-from collections import deque
+import sys
+from pathlib import Path
 
-points = set()
+import numpy as np
 
-with open("input.txt", "r") as f:
+sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-    digit = r"\d+"
+from aoc_utils.graph import UNREACHED, bfs, lattice_graph
+from aoc_utils.utils import int_rows
 
-    for line in f:
-        points.add(tuple(map(int, re.findall(digit, line))))
+# A layer of air for the steam to flow around the droplet, and a wall outside
+# it so lattice steps never leave the box
+PAD = 2
 
-outside_points = set()
-inside_points = set()
 
+def parse_input(data):
+    points = int_rows(data, 3)
+    points = points - points.min(axis=0) + PAD
 
-def is_outside(x, y, z, part):
+    lava = np.zeros(points.max(axis=0) + PAD + 1, dtype=bool)
+    lava[tuple(points.T)] = True
 
-    if (x, y, z) in outside_points:
-        return True
-    if (x, y, z) in inside_points:
-        return False
+    return lava
 
-    seen_points = set()
-    queue = deque([(x, y, z)])
 
-    while queue:
-        x, y, z = queue.popleft()
+def surface_area(data, part):
+    lava = parse_input(data)
+    offsets = [sign * stride // lava.itemsize for stride in lava.strides for sign in (1, -1)]
 
-        if (x, y, z) in points or (x, y, z) in seen_points:
-            continue
+    # The cell on the other side of every cube face
+    cubes = np.flatnonzero(lava)
+    faces = np.concatenate([cubes + offset for offset in offsets])
 
-        seen_points.add((x, y, z))
+    if part == 1:
+        return int(np.count_nonzero(~lava.ravel()[faces]))
 
-        # Check if the point is inside the cavity in part 2
-        if len(seen_points) > (10000 if part == 2 else 0):
-            for point in seen_points:
-                outside_points.add(point)
-            return True
+    wall = np.ones(lava.shape, dtype=bool)
+    wall[1:-1, 1:-1, 1:-1] = False
+    air = ~(lava | wall)
 
-        queue.append((x - 1, y, z))
-        queue.append((x + 1, y, z))
-        queue.append((x, y - 1, z))
-        queue.append((x, y + 1, z))
-        queue.append((x, y, z - 1))
-        queue.append((x, y, z + 1))
+    # Flood the steam in from a corner of the box
+    corner = np.ravel_multi_index((1, 1, 1), lava.shape)
+    steam = bfs(lattice_graph(lava.ravel(), air.ravel(), offsets), corner)
 
-    for point in seen_points:
-        inside_points.add(point)
+    return int(np.count_nonzero(steam.distance[faces] != UNREACHED))
 
-    return False
 
+def part1(data):
+    return surface_area(data, 1)
 
-surface_area = 0
-
-for x, y, z in points:
-    if is_outside(x - 1, y, z, 1):
-        surface_area += 1
-    if is_outside(x + 1, y, z, 1):
-        surface_area += 1
-    if is_outside(x, y - 1, z, 1):
-        surface_area += 1
-    if is_outside(x, y + 1, z, 1):
-        surface_area += 1
-    if is_outside(x, y, z - 1, 1):
-        surface_area += 1
-    if is_outside(x, y, z + 1, 1):
-        surface_area += 1
-
-# Part 1
-print(surface_area)
 
 """
 Something seems off about your calculation. The cooling rate depends on exterior surface area, but your calculation also included the surface area of air pockets trapped in the lava droplet.
@@ -111,23 +90,21 @@ In the larger example above, exactly one cube of air is trapped within the lava
 What is the exterior surface area of your scanned lava droplet?
 """
 
-outside_points = set()
-inside_points = set()
-surface_area = 0
-
-for x, y, z in points:
-    if is_outside(x - 1, y, z, 2):
-        surface_area += 1
-    if is_outside(x + 1, y, z, 2):
-        surface_area += 1
-    if is_outside(x, y - 1, z, 2):
-        surface_area += 1
-    if is_outside(x, y + 1, z, 2):
-        surface_area += 1
-    if is_outside(x, y, z - 1, 2):
-        surface_area += 1
-    if is_outside(x, y, z + 1, 2):
-        surface_area += 1
-
-# Part 2
-print(surface_area)
+
+def part2(data):
+    return surface_area(data, 2)
+
+
+def solve(data):
+    return part1(data), part2(data)
+
+
+if __name__ == "__main__":
+    with open("input.txt", "r") as f:
+        data = f.read()
+
+    # Part 1
+    print(part1(data))
+
+    # Part 2
+    print(part2(data))
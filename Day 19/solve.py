@@ -169,12 +169,8 @@ Determine the quality level of each blueprint using the largest number of geodes
 import sys
 from collections import deque
 
-infile = sys.argv[1] if len(sys.argv) > 1 else "input.txt"
-data = open(infile).read().strip()
-lines = [x for x in data.split("\n")]
 
-
-def solve(Co, Cc, Co1, Co2, Cg1, Cg2, T):
+def max_geodes(Co, Cc, Co1, Co2, Cg1, Cg2, T):
     best = 0
     # state is (ore, clay, obsidian, geodes, r1, r2, r3, r4, time)
     S = (0, 0, 0, 0, 1, 0, 0, 0, T)
@@ -225,40 +221,38 @@ def solve(Co, Cc, Co1, Co2, Cg1, Cg2, T):
     return best
 
 
-p1 = 0
-p2 = 1
-for i, line in enumerate(lines):
-    words = line.split()
-    id_ = int(words[1][:-1])
-    ore_cost = int(words[6])
-    clay_cost = int(words[12])
-    obsidian_cost_ore, obsidian_cost_clay = int(words[18]), int(words[21])
-    geode_cost_ore, geode_cost_clay = int(words[27]), int(words[30])
-    s1 = solve(
-        ore_cost,
-        clay_cost,
-        obsidian_cost_ore,
-        obsidian_cost_clay,
-        geode_cost_ore,
-        geode_cost_clay,
-        24,
-    )
-    p1 += id_ * s1
-    if i < 3:
-        s2 = solve(
-            ore_cost,
-            clay_cost,
-            obsidian_cost_ore,
-            obsidian_cost_clay,
-            geode_cost_ore,
-            geode_cost_clay,
-            32,
+def parse_input(data):
+    blueprints = []
+
+    for line in data.strip().split("\n"):
+        words = line.split()
+        id_ = int(words[1][:-1])
+        ore_cost = int(words[6])
+        clay_cost = int(words[12])
+        obsidian_cost_ore, obsidian_cost_clay = int(words[18]), int(words[21])
+        geode_cost_ore, geode_cost_clay = int(words[27]), int(words[30])
+        blueprints.append(
+            (
+                id_,
+                ore_cost,
+                clay_cost,
+                obsidian_cost_ore,
+                obsidian_cost_clay,
+                geode_cost_ore,
+                geode_cost_clay,
+            )
         )
-        p2 *= s2
+
+    return blueprints
 
 
-# Part 1
-print(p1)
+def part1(data):
+    p1 = 0
+    for id_, *costs in parse_input(data):
+        s1 = max_geodes(*costs, 24)
+        p1 += id_ * s1
+    return p1
+
 
 """
 While you were choosing the best blueprint, the elephants found some food on their own, so you're not in as much of a hurry; you figure you probably have 32 minutes before the wind changes direction again and you'll need to get out of range of the erupting volcano.
@@ -468,5 +462,25 @@ You no longer have enough blueprints to worry about quality levels. Instead, for
 Don't worry about quality levels; instead, just determine the largest number of geodes you could open using each of the first three blueprints. What do you get if you multiply these numbers together?
 """
 
-# Part 2
-print(p2)
+
+def part2(data):
+    p2 = 1
+    for _, *costs in parse_input(data)[:3]:
+        s2 = max_geodes(*costs, 32)
+        p2 *= s2
+    return p2
+
+
+def solve(data):
+    return part1(data), part2(data)
+
+
+if __name__ == "__main__":
+    infile = sys.argv[1] if len(sys.argv) > 1 else "input.txt"
+    data = open(infile).read()
+
+    # Part 1
+    print(part1(data))
+
+    # Part 2
+    print(part2(data))
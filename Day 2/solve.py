@@ -26,11 +26,14 @@ In this example, if you were to follow the strategy guide, you would get a total
 What would your total score be if everything goes exactly according to your strategy guide?
 """
 
-with open("input.txt") as f:
-    rounds = f.read().splitlines()
+import sys
+from pathlib import Path
 
-    # Make every element a tuple of (opponent, you)
-    rounds = [tuple(x.split()) for x in rounds]
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from aoc_utils.loader import MappedInput
 
 # Results
 WIN = 6
@@ -55,9 +58,6 @@ outcomes = {
     ("C", "Z"): Z + DRAW,
 }
 
-# Calculate strategy score
-print(sum(outcomes[x] for x in rounds))
-
 # New strategy definitions
 A = 1  # Rock
 B = 2  # Paper
@@ -66,7 +66,7 @@ X = 0  # Lose
 Y = 3  # Draw
 Z = 6  # Win
 
-outcomes = {
+new_outcomes = {
     ("A", "X"): C + X,
     ("A", "Y"): A + Y,
     ("A", "Z"): B + Z,
@@ -78,5 +78,107 @@ outcomes = {
     ("C", "Z"): A + Z,
 }
 
-# Calculate new strategy score
-print(sum(outcomes[x] for x in rounds))
+
+def split_rounds(raw):
+    # Opponent and own letter indices if raw is laid out exactly as "A X\n"
+    # rounds, otherwise None
+    if len(raw) % 4 not in (0, 3):
+        return None
+
+    opponent = raw[0::4] - ord("A")
+    you = raw[2::4] - ord("X")
+
+    if not (
+        len(opponent) == len(you)
+        and (raw[1::4] == ord(" ")).all()
+        and (raw[3::4] == ord("\n")).all()
+        and (opponent < 3).all()
+        and (you < 3).all()
+    ):
+        return None
+
+    return opponent, you
+
+
+def parse_input(data):
+    # How often each of the 9 possible rounds occurs. Every round is the bytes
+    # "A X\n", so opponent and own letters sit at fixed offsets 4 bytes apart
+    raw = np.frombuffer(data.encode() if isinstance(data, str) else data, dtype=np.uint8)
+    rounds = split_rounds(raw)
+
+    if rounds is None:
+        # Rebuild the layout from the letters, for CRLF or extra blank lines
+        letters = bytes(raw).split()
+        if len(letters) % 2:
+            raise ValueError("every round needs an opponent and an own letter")
+
+        normalised = b"\n".join(b" ".join(pair) for pair in zip(letters[::2], letters[1::2]))
+        rounds = split_rounds(np.frombuffer(normalised, dtype=np.uint8))
+
+        if rounds is None:
+            raise ValueError("rounds must be an opponent A-C and an own letter X-Z")
+
+    opponent, you = rounds
+    return np.bincount(opponent * 3 + you, minlength=9)
+
+
+def compile_strategy(strategy):
+    # Flatten a {("opponent", "you"): score} dict into the same 9 slots
+    table = np.zeros(9, dtype=np.int64)
+
+    for (opponent, you), score in strategy.items():
+        if opponent not in "ABC" or you not in "XYZ":
+            raise ValueError(f"unknown round {opponent} {you}")
+
+        table[(ord(opponent) - ord("A")) * 3 + ord(you) - ord("X")] = score
+
+    return table
+
+
+class Tournament:
+    """Score any number of strategies against the same rounds."""
+
+    def __init__(self, strategies):
+        # {name: {("opponent", "you"): score}}, compiled to one row per strategy
+        self.names = list(strategies)
+        self.table = np.stack([compile_strategy(strategy) for strategy in strategies.values()])
+
+    def add(self, name, strategy):
+        self.names.append(name)
+        self.table = np.vstack([self.table, compile_strategy(strategy)])
+
+    def score(self, data):
+        # The rounds are counted once, however many strategies there are
+        return dict(zip(self.names, (self.table @ parse_input(data)).tolist()))
+
+    def score_file(self, path):
+        # Count the rounds straight from a read-only memory map of the file
+        with MappedInput(path) as puzzle:
+            return self.score(puzzle.view())
+
+
+def part1(data):
+    # Calculate strategy score
+    return Tournament({"outcomes": outcomes}).score(data)["outcomes"]
+
+
+def part2(data):
+    # Calculate new strategy score
+    return Tournament({"new_outcomes": new_outcomes}).score(data)["new_outcomes"]
+
+
+def solve(data):
+    # Both strategies from a single pass over the rounds
+    scores = Tournament({"outcomes": outcomes, "new_outcomes": new_outcomes}).score(data)
+    return scores["outcomes"], scores["new_outcomes"]
+
+
+if __name__ == "__main__":
+    with open("input.txt") as f:
+        data = f.read()
+
+    # Part 1
+    print(part1(data))
+
+    # Part 2
+    print(part2(data))
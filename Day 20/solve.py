@@ -53,16 +53,13 @@ Then, the grove coordinates can be found by looking at the 1000th, 2000th, and 3
 
 Mix your encrypted file exactly once. What is the sum of the three numbers that form the grove coordinates?
 """
+
 import sys
 from collections import deque
 
-infile = sys.argv[1] if len(sys.argv) > 1 else "input.txt"
-data = open(infile).read().strip()
-lines = [x for x in data.split("\n")]
-
 
-def solve(part):
-    X = [int(x) for x in lines]
+def mix(data, part):
+    X = [int(x) for x in data.strip().split("\n")]
     if part == 2:
         X = [x * 811589153 for x in X]
     X = deque(list(enumerate(X)))
@@ -91,8 +88,9 @@ def solve(part):
     )
 
 
-# Part 1
-print(solve(1))
+def part1(data):
+    return mix(data, 1)
+
 
 """
 The grove coordinate values seem nonsensical. While you ponder the mysteries of Elf encryption, you suddenly remember the rest of the decryption routine you overheard back at camp.
@@ -140,5 +138,21 @@ The grove coordinates can still be found in the same way. Here, the 1000th numbe
 Apply the decryption key and mix your encrypted file ten times. What is the sum of the three numbers that form the grove coordinates?
 """
 
-# Part 2
-print(solve(2))
+
+def part2(data):
+    return mix(data, 2)
+
+
+def solve(data):
+    return part1(data), part2(data)
+
+
+if __name__ == "__main__":
+    infile = sys.argv[1] if len(sys.argv) > 1 else "input.txt"
+    data = open(infile).read()
+
+    # Part 1
+    print(part1(data))
+
+    # Part 2
+    print(part2(data))
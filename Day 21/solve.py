@@ -41,12 +41,18 @@ However, your actual situation involves considerably more monkeys. What number w
 """
 import sys
 
-infile = sys.argv[1] if len(sys.argv)>1 else 'input.txt'
-data = open(infile).read().strip()
-lines = [x for x in data.split('\n')]
 
-E = {}
-def f(name, h):
+def parse_input(data):
+    E = {}
+    for line in data.strip().split('\n'):
+        words = line.split()
+        name = words[0][:-1]
+        expr = line.split(':')[1]
+        E[name] = expr.split()
+    return E
+
+
+def f(E, name, h):
     words = E[name]
     if name == 'humn' and h >= 0:
         return h
@@ -54,8 +60,8 @@ def f(name, h):
     try:
         return int(words[0])
     except:
-        e1 = f(words[0],h)
-        e2 = f(words[2],h)
+        e1 = f(E, words[0],h)
+        e2 = f(E, words[2],h)
 
         match words[1]:
             case '+':
@@ -67,14 +73,10 @@ def f(name, h):
             case '/':
                 return e1 / e2
 
-for line in lines:
-    words = line.split()
-    name = words[0][:-1]
-    expr = line.split(':')[1]
-    E[name] = expr.split()
 
-# Part 1
-print(int(f('root', -1)))
+def part1(data):
+    return int(f(parse_input(data), 'root', -1))
+
 
 """
 Due to some kind of monkey-elephant-human mistranslation, you seem to have misunderstood a few key details about the riddle.
@@ -88,25 +90,43 @@ In the above example, the number you need to yell to pass root's equality test i
 What number do you yell to pass root's equality test?
 """
 
-p1 = E['root'][0]
-p2 = E['root'][2]
 
-if f(p2,0) != f(p2,1):
-    p1,p2 = p2,p1
+def part2(data):
+    E = parse_input(data)
+
+    p1 = E['root'][0]
+    p2 = E['root'][2]
+
+    if f(E, p2,0) != f(E, p2,1):
+        p1,p2 = p2,p1
+
+    target = f(E, p2,0)
+
+    lo = 0
+    hi = int(1e20)
+    while lo < hi:
+        mid = (lo+hi)//2
+        score = target - f(E, p1, mid)
+        if score < 0:
+            lo = mid
+        elif score == 0:
+            break
+        else:
+            hi = mid
+
+    return mid
+
+
+def solve(data):
+    return part1(data), part2(data)
+
 
-target = f(p2,0)
+if __name__ == '__main__':
+    infile = sys.argv[1] if len(sys.argv)>1 else 'input.txt'
+    data = open(infile).read()
 
-lo = 0
-hi = int(1e20)
-while lo < hi:
-    mid = (lo+hi)//2
-    score = target - f(p1, mid)
-    if score < 0:
-        lo = mid
-    elif score == 0:
-        break
-    else:
-        hi = mid
+    # Part 1
+    print(part1(data))
 
-# Part 2
-print(mid)
\ No newline at end of file
+    # Part 2
+    print(part2(data))
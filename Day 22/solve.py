@@ -4,27 +4,19 @@ import sys
 from collections import defaultdict, deque
 from copy import deepcopy
 from decimal import Decimal
+from pathlib import Path
 
-infile = sys.argv[1] if len(sys.argv)>1 else 'input.txt'
-data = open(infile).read()
-lines = [x for x in data.split('\n')]
+import numpy as np
 
-G, instr = data.split('\n\n')
-G = G.split('\n')
-instr = instr.strip()
+sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-D = [(-1,0),(0,1),(1,0),(0,-1)]
+from aoc_utils.grid import Grid
 
-R = len(G)
-C = len(G[0])
-for r in range(R):
-    while len(G[r]) < C:
-        G[r] += ' '
-    assert len(G[r])==C
+# 0=up, 1=right, 2=down, 3=left
+DIRECTIONS = ['up','right','down','left']
 
-CUBE = C//3
-assert CUBE == R//4
-#print(CUBE)
+VOID, OPEN, WALL = 0, 1, 2
+TILES = {' ':VOID, '.':OPEN, '#':WALL}
 
 # .12
 # .3.
@@ -32,120 +24,153 @@ assert CUBE == R//4
 # 6..
 REGION = [(0,1),(0,2),(1,1),(2,1),(2,0),(3,0)]
 
-def regionToGlobal(r,c,region):
-    rr,cc = REGION[region-1]
-    return (rr*CUBE+r,cc*CUBE+c)
-
-def getRegion(r,c):
-    for i,(rr,cc) in enumerate(REGION):
-        if rr*CUBE<=r<(rr+1)*CUBE and cc*CUBE<=c<(cc+1)*CUBE:
-            return (i+1, r-rr*CUBE, c-cc*CUBE)
-    assert False, (r,c)
-
-def newCoords(r,c,d,nd):
-    if d==0:
-        assert r==0
-        x = c
-    if d==1:
-        assert c==CUBE-1
-        x = r
-    if d==2:
-        assert r==CUBE-1
-        x = CUBE-1-c
-    if d==3:
-        assert c==0
-        x = CUBE-1-r
-
-    if nd==0:
-        return (CUBE-1,x)
-    if nd==1:
-        return (x,0)
-    if nd==2:
-        return (0,CUBE-1-x)
-    if nd==3:
-        return (CUBE-1-x,CUBE-1)
-
-#  3   6
-# 542 512
-#  6   3
-
-#  1   5
-# 532 164
-#  4   2
-
-#  3   3
-# 124 154
-#  6   6
-
-def getDest(r,c,d,part):
-    if part == 1:
-        r = (r+D[d][0])%R
-        c = (c+D[d][1])%C
-        while G[r][c]==' ':
-            r = (r+D[d][0])%R
-            c =(c+D[d][1])%C
-        return (r,c,d)
-
-    region,rr,rc = getRegion(r,c)
-    # 0=up, 1=right,2=down,3=left
-    # If I am leaving region R in direction D, I enter region NR in direction ND
-    newRegion,nd = {
-        (4,0):(3,0), (4,1):(2,3), (4,2):(6,3), (4,3):(5,3),
-        (1,0):(6,1), (1,1):(2,1), (1,2):(3,2), (1,3):(5,1),
-        (3,0):(1,0), (3,1):(2,0), (3,2):(4,2), (3,3):(5,2),
-        (6,0):(5,0), (6,1):(4,0), (6,2):(2,2), (6,3):(1,2),
-        (2,0):(6,0), (2,1):(4,3), (2,2):(3,3), (2,3):(1,3),
-        (5,0):(3,1), (5,1):(4,1), (5,2):(6,2), (5,3):(1,1)}[(region,d)]
-
-    nr,nc = newCoords(rr,rc,d,nd)
-    assert 0<=nr<CUBE and 0<=nc<CUBE
-    nr,nc = regionToGlobal(nr,nc,newRegion)
-    assert G[nr][nc] in ['.','#'], f'{G[nr][nc]}'
-    return (nr,nc,nd)
-
-def solve(part):
-    # compute starting location
-    r = 0
-    c = 0
-    d = 1
-    while G[r][c] != '.':
-        c += 1
-
-    i = 0
-    while i < len(instr):
-        n = 0
-        while i<len(instr) and instr[i].isdigit():
-            n = n*10 + int(instr[i])
-            i += 1
-        for _ in range(n):
-            #print(r,c,d)
-            assert G[r][c]=='.',(r,c)
-            rr = (r+D[d][0])%R
-            cc = (c+D[d][1])%C
-            if G[rr][cc]==' ':
-                (nr,nc,nd) = getDest(r,c,d,part)
-                #print(f'r={r} c={c} rr={rr} cc={cc} nr={nr} nc={nc} region={getRegion(r,c)} d={d} newRegion={getRegion(nr,nc)} nd={nd}')
-                if G[nr][nc]=='#':
+class Board:
+    def __init__(self, data):
+        G, instr = data.split('\n\n')
+        self.instr = instr.strip()
+
+        # Padded with void, so walking off the map looks the same as walking
+        # into a gap inside it
+        self.grid = Grid.from_text(G, mapping=TILES, fill=VOID, dtype=np.uint8)
+        self.steps = [self.grid.offsets[name] for name in DIRECTIONS]
+        # The walk never changes the board; a plain list makes the per-step
+        # lookups much cheaper than NumPy scalar indexing
+        self.tiles = self.grid.flat.tolist()
+
+        self.R = self.grid.height
+        self.C = self.grid.width
+
+        self.CUBE = self.C//3
+        assert self.CUBE == self.R//4
+        #print(CUBE)
+
+    def regionToGlobal(self,r,c,region):
+        rr,cc = REGION[region-1]
+        return (rr*self.CUBE+r,cc*self.CUBE+c)
+
+    def getRegion(self,r,c):
+        CUBE = self.CUBE
+        for i,(rr,cc) in enumerate(REGION):
+            if rr*CUBE<=r<(rr+1)*CUBE and cc*CUBE<=c<(cc+1)*CUBE:
+                return (i+1, r-rr*CUBE, c-cc*CUBE)
+        assert False, (r,c)
+
+    def newCoords(self,r,c,d,nd):
+        CUBE = self.CUBE
+        if d==0:
+            assert r==0
+            x = c
+        if d==1:
+            assert c==CUBE-1
+            x = r
+        if d==2:
+            assert r==CUBE-1
+            x = CUBE-1-c
+        if d==3:
+            assert c==0
+            x = CUBE-1-r
+
+        if nd==0:
+            return (CUBE-1,x)
+        if nd==1:
+            return (x,0)
+        if nd==2:
+            return (0,CUBE-1-x)
+        if nd==3:
+            return (CUBE-1-x,CUBE-1)
+
+    #  3   6
+    # 542 512
+    #  6   3
+
+    #  1   5
+    # 532 164
+    #  4   2
+
+    #  3   3
+    # 124 154
+    #  6   6
+
+    def getDest(self,r,c,d,part):
+        grid = self.grid
+        if part == 1:
+            # Wrap to the last tile looking back the other way
+            index = grid.index(r,c)
+            for cell in grid.ray(index,DIRECTIONS[(d+2)%4]):
+                if self.tiles[cell]==VOID:
+                    break
+                index = cell
+            return (*grid.position(index),d)
+
+        region,rr,rc = self.getRegion(r,c)
+        # 0=up, 1=right,2=down,3=left
+        # If I am leaving region R in direction D, I enter region NR in direction ND
+        newRegion,nd = {
+            (4,0):(3,0), (4,1):(2,3), (4,2):(6,3), (4,3):(5,3),
+            (1,0):(6,1), (1,1):(2,1), (1,2):(3,2), (1,3):(5,1),
+            (3,0):(1,0), (3,1):(2,0), (3,2):(4,2), (3,3):(5,2),
+            (6,0):(5,0), (6,1):(4,0), (6,2):(2,2), (6,3):(1,2),
+            (2,0):(6,0), (2,1):(4,3), (2,2):(3,3), (2,3):(1,3),
+            (5,0):(3,1), (5,1):(4,1), (5,2):(6,2), (5,3):(1,1)}[(region,d)]
+
+        nr,nc = self.newCoords(rr,rc,d,nd)
+        assert 0<=nr<self.CUBE and 0<=nc<self.CUBE
+        nr,nc = self.regionToGlobal(nr,nc,newRegion)
+        assert grid.cells[nr,nc]!=VOID, (nr,nc)
+        return (nr,nc,nd)
+
+    def walk(self,part):
+        grid,instr,steps = self.grid,self.instr,self.steps
+        tiles = self.tiles
+        # compute starting location
+        position = grid.index(0,int(np.argmax(grid.cells[0]==OPEN)))
+        d = 1
+
+        i = 0
+        while i < len(instr):
+            n = 0
+            while i<len(instr) and instr[i].isdigit():
+                n = n*10 + int(instr[i])
+                i += 1
+            for _ in range(n):
+                ahead = position+steps[d]
+                if tiles[ahead]==VOID:
+                    (nr,nc,nd) = self.getDest(*grid.position(position),d,part)
+                    ahead = grid.index(nr,nc)
+                    if tiles[ahead]==WALL:
+                        break
+                    (position,d) = (ahead,nd)
+                elif tiles[ahead]==WALL:
                     break
-                (r,c,d) = (nr,nc,nd)
-                continue
-            elif G[rr][cc]=='#':
+                else:
+                    position = ahead
+            if i==len(instr):
                 break
+            turn = instr[i]
+            if turn == 'L':
+                d = (d+3)%4
+            elif turn == 'R':
+                d = (d+1)%4
             else:
-                r = rr
-                c = cc
-        if i==len(instr):
-            break
-        turn = instr[i]
-        if turn == 'L':
-            d = (d+3)%4
-        elif turn == 'R':
-            d = (d+1)%4
-        else:
-            assert False, (i,instr[i:],instr[i])
-        i += 1
-        #print('TURN', d)
-    DV = {0:3,1:0,2:1,3:2}
-    return ((r+1)*1000 + (c+1)*4 + DV[d])
-print(solve(1))
-print(solve(2))
\ No newline at end of file
+                assert False, (i,instr[i:],instr[i])
+            i += 1
+            #print('TURN', d)
+        DV = {0:3,1:0,2:1,3:2}
+        r,c = grid.position(position)
+        return ((r+1)*1000 + (c+1)*4 + DV[d])
+
+def part1(data):
+    return Board(data).walk(1)
+
+def part2(data):
+    return Board(data).walk(2)
+
+def solve(data):
+    return part1(data), part2(data)
+
+if __name__ == '__main__':
+    infile = sys.argv[1] if len(sys.argv)>1 else 'input.txt'
+    data = open(infile).read()
+
+    print(part1(data))
+    print(part2(data))
@@ -30,6 +30,11 @@ In the above example, the priority of the item type that appears in both compart
 Find the item type that appears in both compartments of each rucksack. What is the sum of the priorities of those item types?
 """
 
+import string
+import sys
+
+import numpy as np
+
 lowercase_offset = 96
 uppercase_offset = 38
 
@@ -41,22 +46,121 @@ def get_priority(item):
         return ord(item) - uppercase_offset
 
 
-with open("input.txt") as f:
-    rucksacks = f.read().splitlines()
+# Priority of each item type, indexed by byte value
+priorities = [0] * 256
+for item in string.ascii_letters:
+    priorities[ord(item)] = get_priority(item)
+
+# Presence matrix column of each item type, indexed by byte value. Newlines
+# get a spare column, other whitespace is dropped and anything else is invalid
+NEWLINE_COLUMN, WHITESPACE, INVALID = 52, 53, 255
+
+item_columns = np.full(256, INVALID, dtype=np.uint8)
+for item in string.ascii_letters:
+    item_columns[ord(item)] = priorities[ord(item)] - 1
+for item in string.whitespace:
+    item_columns[ord(item)] = WHITESPACE
+item_columns[ord("\n")] = NEWLINE_COLUMN
+
+
+def read_rucksacks(lines):
+    # Lazily strip line endings from bytes lines, skipping blank ones
+    for line in lines:
+        line = line.rstrip()
+        if line:
+            yield line
+
+
+def group_rucksacks(rucksacks):
+    # Lazily group rucksacks three at a time; a short last group is kept too
+    group = []
+
+    for rucksack in rucksacks:
+        group.append(rucksack)
+        if len(group) == 3:
+            yield group
+            group = []
+
+    if group:
+        yield group
+
+
+def group_priorities(groups):
+    # Lazily yield (compartment priorities, badge priority) for each group.
+    # The sets hold byte values, so a shared item maps straight to its
+    # priority
+    for group in groups:
+        compartments = 0
+        for rucksack in group:
+            half = len(rucksack) // 2
+            compartments += priorities[set(rucksack[:half]).intersection(rucksack[half:]).pop()]
+
+        badge = 0
+        if len(group) == 3:
+            badge = priorities[set(group[0]).intersection(group[1], group[2]).pop()]
+
+        yield compartments, badge
+
+
+def rucksack_priorities(lines):
+    # Both parts in one pass, holding a single group of lines at a time
+    compartments = badges = 0
+
+    for group_compartments, badge in group_priorities(group_rucksacks(read_rucksacks(lines))):
+        compartments += group_compartments
+        badges += badge
 
+    return compartments, badges
 
-total = 0
 
-for rucksack in rucksacks:
-    first_half = set(rucksack[: len(rucksack) // 2])
-    second_half = set(rucksack[len(rucksack) // 2 :])
+def presence_matrices(data):
+    # (N, 52) boolean matrices of the items in each rucksack's first and
+    # second half, built from the raw bytes without a per-line loop
+    raw = np.frombuffer(data.encode(), dtype=np.uint8)
+    columns = item_columns[raw]
 
-    common = first_half.intersection(second_half)
+    if (columns == INVALID).any():
+        unknown = sorted({chr(byte) for byte in raw[columns == INVALID].tolist()})
+        raise ValueError(f"unknown items: {unknown}")
 
-    total += get_priority(common.pop())
+    # Drop CRs and stray spaces so they do not shift the midpoints
+    if (columns == WHITESPACE).any():
+        raw = raw[columns != WHITESPACE]
+        columns = columns[columns != WHITESPACE]
+
+    newlines = np.flatnonzero(raw == ord("\n"))
+    starts = np.r_[0, newlines + 1]
+    lengths = np.r_[newlines, len(raw)] - starts
+
+    # Halves are numbered 2 * rucksack + half; every line start and midpoint
+    # begins the next one, so a running count of them numbers every byte
+    boundaries = np.bincount(np.r_[starts, starts + lengths // 2], minlength=len(raw))
+    half = np.cumsum(boundaries[: len(raw)]) - 1
+
+    # Newlines land in a spare 53rd column
+    presence = np.zeros((len(starts), 2, 53), dtype=bool)
+    presence.reshape(-1)[half * 53 + columns] = True
+    presence = presence[lengths > 0, :, :52]
+
+    return presence[:, 0], presence[:, 1]
+
+
+def vectorised_priorities(data):
+    first_half, second_half = presence_matrices(data)
+
+    # Column i is the item of priority i + 1
+    compartments = (first_half & second_half).argmax(axis=1) + 1
+
+    rucksacks = first_half | second_half
+    groups = rucksacks[: len(rucksacks) // 3 * 3].reshape(-1, 3, 52)
+    badges = groups.all(axis=1).argmax(axis=1) + 1
+
+    return int(compartments.sum()), int(badges.sum())
+
+
+def part1(data):
+    return vectorised_priorities(data)[0]
 
-# Part 1
-print(total)
 
 """
 As you finish identifying the misplaced items, the Elves come to you with another issue.
@@ -84,14 +188,31 @@ Priorities for these items must still be found to organize the sticker attachmen
 Find the item type that corresponds to the badges of each three-Elf group. What is the sum of the priorities of those item types?
 """
 
-total = 0
 
-for rucksack_1, rucksack_2, rucksack_3 in zip(
-    rucksacks[::3], rucksacks[1::3], rucksacks[2::3]
-):
-    common = set(rucksack_1).intersection(set(rucksack_2), set(rucksack_3))
+def part2(data):
+    return vectorised_priorities(data)[1]
+
+
+def solve(data):
+    return vectorised_priorities(data)
+
+
+if __name__ == "__main__":
+    # Stream a file, or stdin given as "-", in constant memory
+    if len(sys.argv) > 1:
+        if sys.argv[1] == "-":
+            print(*rucksack_priorities(sys.stdin.buffer), sep="\n")
+        else:
+            with open(sys.argv[1], "rb") as f:
+                print(*rucksack_priorities(f), sep="\n")
+
+        sys.exit()
+
+    with open("input.txt") as f:
+        data = f.read()
 
-    total += get_priority(common.pop())
+    # Part 1
+    print(part1(data))
 
-# Part 2
-print(total)
+    # Part 2
+    print(part2(data))
@@ -40,33 +40,110 @@ Some of the pairs have noticed that one of their assignments fully contains the
 In how many assignment pairs does one range fully contain the other?
 """
 
-import re
-from itertools import zip_longest
+import argparse
+import sys
+import time
+from pathlib import Path
 
-with open("input.txt") as f:
-    sections = [int(section) for line in f for section in re.findall(r"(\d+)", line)]
+import numpy as np
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-def grouper(iterable, n, fillvalue=None):
-    args = [iter(iterable)] * n
-    return zip_longest(*args, fillvalue=fillvalue)
+from aoc_utils.utils import int_rows
 
 
-overlapping = 0
+def parse_input(data):
+    # One (first start, first end, second start, second end) row per pair
+    return int_rows(data, 4)
 
-for pairs in grouper(sections, 4):
-    a, b, c, d = pairs
 
-    first_sections = set(range(a, b + 1))
-    second_sections = set(range(c, d + 1))
+def pair_counts(data):
+    # Containment and overlap straight from the endpoints, for every pair at
+    # once, instead of materialising the sections
+    a, b, c, d = parse_input(data).T
 
-    if first_sections.issubset(second_sections) or second_sections.issubset(
-        first_sections
-    ):
-        overlapping += 1
+    contained = ((c <= a) & (b <= d)) | ((a <= c) & (d <= b))
+    overlapping = (a <= d) & (c <= b)
 
-# Part 1
-print(overlapping)
+    return int(contained.sum()), int(overlapping.sum())
+
+
+class CoverageIndex:
+    """How many assignments cover each section, over any number of intervals."""
+
+    def __init__(self, intervals):
+        # Inclusive (start, end) rows, e.g. every elf's assignment
+        intervals = np.asarray(intervals).reshape(-1, 2)
+
+        self.starts = np.sort(intervals[:, 0])
+        self.ends = np.sort(intervals[:, 1])
+
+    @classmethod
+    def from_input(cls, data):
+        return cls(parse_input(data))
+
+    def __len__(self):
+        return len(self.starts)
+
+    def coverage(self, sections):
+        # Intervals starting at or before a section minus those ending before
+        # it, by binary search in O(log N) per section
+        return np.searchsorted(self.starts, sections, "right") - np.searchsorted(
+            self.ends, sections, "left"
+        )
+
+    def max_depth(self):
+        # Sweep the difference array: +1 where an interval starts, -1 just
+        # past where it ends. Returns (depth, first section at that depth)
+        if not len(self):
+            return 0, None
+
+        positions, events = np.unique(np.r_[self.starts, self.ends + 1], return_inverse=True)
+        deltas = np.r_[np.ones(len(self), dtype=np.int64), -np.ones(len(self), dtype=np.int64)]
+        depth = np.cumsum(np.bincount(events, weights=deltas, minlength=len(positions)))
+
+        deepest = depth.argmax()
+        return int(depth[deepest]), int(positions[deepest])
+
+
+def benchmark(data, queries=1000):
+    # Coverage queries and max depth against a scan of every interval
+    intervals = parse_input(data).reshape(-1, 2)
+    sections = np.random.default_rng(0).integers(intervals.min(), intervals.max() + 1, queries)
+
+    start = time.perf_counter()
+    index = CoverageIndex(intervals)
+    built = time.perf_counter()
+    indexed = index.coverage(sections)
+    depth = index.max_depth()
+    indexed_time, build_time = time.perf_counter() - built, built - start
+
+    start = time.perf_counter()
+    scanned = [
+        np.count_nonzero((intervals[:, 0] <= section) & (section <= intervals[:, 1]))
+        for section in sections
+    ]
+    # Depth only rises where an interval starts, so the deepest section is
+    # always one of the start points
+    scan_depth = max(
+        np.count_nonzero((intervals[:, 0] <= section) & (section <= intervals[:, 1]))
+        for section in np.unique(intervals[:, 0])
+    )
+    scan_time = time.perf_counter() - start
+
+    if indexed.tolist() != scanned or depth[0] != scan_depth:
+        raise RuntimeError(
+            f"index and scan disagree: max depth {depth[0]} vs {scan_depth}, "
+            f"{sum(a != b for a, b in zip(indexed.tolist(), scanned))} of {queries} coverage queries differ"
+        )
+
+    print(f"{len(intervals)} intervals, {queries} queries, max depth {depth[0]} at section {depth[1]}")
+    print(f"index build {build_time:.4f}s, queries + depth {indexed_time:.4f}s")
+    print(f"naive scan {scan_time:.4f}s")
+
+
+def part1(data):
+    return pair_counts(data)[0]
 
 
 """
@@ -83,16 +160,38 @@ So, in this example, the number of overlapping assignment pairs is 4.
 In how many assignment pairs do the ranges overlap?
 """
 
-overlapping = 0
 
-for pairs in grouper(sections, 4):
-    a, b, c, d = pairs
+def part2(data):
+    return pair_counts(data)[1]
+
+
+def solve(data):
+    return pair_counts(data)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("sections", nargs="*", type=int, help="count the elves covering these sections")
+    parser.add_argument("--bench", action="store_true", help="time the coverage index against a naive scan")
+    parser.add_argument("-i", "--input", default="input.txt", help="assignment list to read")
+    args = parser.parse_args()
+
+    with open(args.input) as f:
+        data = f.read()
+
+    if args.bench:
+        benchmark(data)
+        sys.exit()
 
-    first_sections = set(range(a, b + 1))
-    second_sections = set(range(c, d + 1))
+    if args.sections:
+        index = CoverageIndex.from_input(data)
+        for section, elves in zip(args.sections, index.coverage(args.sections).tolist()):
+            print(f"Section {section}: {elves} elves")
+        print("Max depth: {} elves at section {}".format(*index.max_depth()))
+        sys.exit()
 
-    if first_sections.intersection(second_sections):
-        overlapping += 1
+    # Part 1
+    print(part1(data))
 
-# Part 2
-print(overlapping)
+    # Part 2
+    print(part2(data))
@@ -50,46 +50,204 @@ The Elves just need to know which crate will end up on top of each stack; in thi
 After the rearrangement procedure completes, what crate ends up on top of each stack?
 """
 
-import re
+import gc
+import random
+import sys
+from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-def parse_input():
-    return open("input.txt").read().splitlines()
+from aoc_utils.utils import int_rows
 
 
-def create_stacks(lines):
-    num_stacks = ((len(lines[0]) + 1) // 4) + 1
-    crate_locations = [i for i in range(1, len(lines[0]), 4)]
+def parse_input(data):
+    drawing, moves = data.split("\n\n")
 
-    stacks = [[] for _ in range(num_stacks)]
+    # Read the drawing column-wise: every fourth character column from the
+    # second holds a stack, bottom crate last. Index 0 stays unused
+    rows = drawing.splitlines()[:-1]
+    width = max(map(len, rows))
+    columns = list(zip(*(row.ljust(width) for row in rows)))
 
-    line = lines.pop(0)
+    # Bottom-first, so the top of a stack is the end of its list
+    stacks = [[]] + [list("".join(reversed(column)).rstrip()) for column in columns[1::4]]
 
-    while line:
-        for i, crate_location in enumerate(crate_locations):
-            crate = line[crate_location]
-            if crate != " " and not crate.isdigit():
-                stacks[i + 1].append(crate)
-        line = lines.pop(0)
+    # One (count, from, to) row per move
+    return stacks, int_rows(moves, 3)
 
-    return lines, stacks
 
+def move_crates(stacks, count, from_stack, to_stack, keep_order):
+    # The top crates are a tail slice, moved in one go. The CrateMover 9000
+    # lifts one crate at a time, which reverses the block; the 9001 does not.
+    # A slice from [-0:] would be the whole stack, so moving nothing returns
+    if not count:
+        return
 
-lines = parse_input()
-lines, stacks = create_stacks(lines)
+    crates = stacks[from_stack][-count:]
+    del stacks[from_stack][-count:]
 
-for line in lines:
-    move = re.findall(r"(\d+)", line)
+    stacks[to_stack].extend(crates if keep_order else reversed(crates))
 
-    stacks_to_move = int(move[0])
-    from_stack = int(move[1])
-    to_stack = int(move[2])
 
-    for _ in range(stacks_to_move):
-        stacks[to_stack].insert(0, stacks[from_stack].pop(0))
+class Rope:
+    """
+    Implicit treap node: an in-order sequence of crates with split and concat
+    in O(log n), and reversal as a lazy flag pushed down on the next visit.
+    """
+
+    __slots__ = ("crate", "priority", "size", "left", "right", "reversed")
+
+    def __init__(self, crate):
+        self.crate = crate
+        self.priority = random.random()
+        self.size = 1
+        self.left = self.right = None
+        self.reversed = False
+
+
+def rope_size(rope):
+    return rope.size if rope else 0
+
+
+def push(rope):
+    if rope.reversed:
+        rope.left, rope.right = rope.right, rope.left
+        for child in (rope.left, rope.right):
+            if child:
+                child.reversed = not child.reversed
+        rope.reversed = False
+
+
+def update(rope):
+    rope.size = 1 + rope_size(rope.left) + rope_size(rope.right)
+
+
+def merge(left, right):
+    if not left or not right:
+        return left or right
+
+    if left.priority > right.priority:
+        push(left)
+        left.right = merge(left.right, right)
+        update(left)
+        return left
+
+    push(right)
+    right.left = merge(left, right.left)
+    update(right)
+    return right
+
+
+def split(rope, count):
+    # The first count crates, and the rest
+    if not rope:
+        return None, None
+
+    push(rope)
+    if rope_size(rope.left) >= count:
+        left, rope.left = split(rope.left, count)
+        update(rope)
+        return left, rope
+
+    rope.right, right = split(rope.right, count - rope_size(rope.left) - 1)
+    update(rope)
+    return rope, right
+
+
+def build_rope(crates):
+    # The treap of crates in O(n) along its right spine, instead of one
+    # O(log n) merge per crate: a new crate pops every spine node of lower
+    # priority, the last of which becomes its left child. A popped node's
+    # subtree is complete, so its size is final
+    spine = []
+    for crate in crates:
+        rope = Rope(crate)
+
+        while spine and spine[-1].priority < rope.priority:
+            rope.left = spine.pop()
+            update(rope.left)
+
+        if spine:
+            spine[-1].right = rope
+        spine.append(rope)
+
+    for rope in reversed(spine):
+        update(rope)
+
+    return spine[0] if spine else None
+
+
+class RopeStack:
+    """Bottom-first crate stack whose block moves cost O(log n) at any height."""
+
+    def __init__(self, crates=()):
+        # A full collection every so often would walk the growing tree and
+        # cost several times the build itself; ropes hold no cycles
+        collecting = gc.isenabled()
+        gc.disable()
+        try:
+            self.root = build_rope(crates)
+        finally:
+            if collecting:
+                gc.enable()
+
+    def __len__(self):
+        return rope_size(self.root)
+
+    def __iter__(self):
+        # In-order walk, bottom crate first
+        pending, rope = [], self.root
+        while pending or rope:
+            if rope:
+                push(rope)
+                pending.append(rope)
+                rope = rope.left
+            else:
+                rope = pending.pop()
+                yield rope.crate
+                rope = rope.right
+
+    def top(self):
+        rope = self.root
+        while True:
+            push(rope)
+            if not rope.right:
+                return rope.crate
+            rope = rope.right
+
+    def move_to(self, other, count, keep_order):
+        self.root, block = split(self.root, len(self) - count)
+        if not block:
+            return
+
+        if not keep_order:
+            block.reversed = not block.reversed
+        other.root = merge(other.root, block)
+
+
+def run_crane(stacks, moves, keep_order, rope=False):
+    # Ropes make moves independent of stack height, lists are faster for
+    # the small blocks of the puzzle input. The parsed stacks are left as is
+    if rope:
+        stacks = [RopeStack(stack) for stack in stacks]
+    else:
+        stacks = [stack.copy() for stack in stacks]
+
+    for stacks_to_move, from_stack, to_stack in moves.tolist():
+        if rope:
+            stacks[from_stack].move_to(stacks[to_stack], stacks_to_move, keep_order)
+        else:
+            move_crates(stacks, stacks_to_move, from_stack, to_stack, keep_order)
+
+    if rope:
+        return "".join([stack.top() for stack in stacks[1:]])
+
+    return "".join([stack[-1] for stack in stacks[1:]])
+
+
+def part1(data):
+    return run_crane(*parse_input(data), keep_order=False)
 
-# Part 1
-print("".join([stack[0] for stack in stacks[1:]]))
 
 """
 As you watch the crane operator expertly rearrange the crates, you notice the process isn't following your prediction.
@@ -136,20 +294,23 @@ In this example, the CrateMover 9001 has put the crates in a totally different o
 Before the rearrangement process finishes, update your simulation so that the Elves know where they should stand to be ready to unload the final supplies. After the rearrangement procedure completes, what crate ends up on top of each stack?
 """
 
-lines = parse_input()
-lines, stacks = create_stacks(lines)
 
-for line in lines:
-    move = re.findall(r"(\d+)", line)
+def part2(data):
+    return run_crane(*parse_input(data), keep_order=True)
+
+
+def solve(data):
+    # Both crane models from the same parsed drawing and moves
+    stacks, moves = parse_input(data)
+    return run_crane(stacks, moves, keep_order=False), run_crane(stacks, moves, keep_order=True)
 
-    stacks_to_move = int(move[0])
-    from_stack = int(move[1])
-    to_stack = int(move[2])
 
-    stacks_moved = stacks[from_stack][:stacks_to_move]
+if __name__ == "__main__":
+    with open("input.txt") as f:
+        data = f.read()
 
-    stacks[to_stack] = stacks_moved + stacks[to_stack]
-    stacks[from_stack] = stacks[from_stack][stacks_to_move:]
+    # Part 1
+    print(part1(data))
 
-# Part 2
-print("".join([stack[0] for stack in stacks[1:]]))
+    # Part 2
+    print(part2(data))
@@ -29,15 +29,135 @@ zcfzfwzzqfrljwzlrfnpqdbhtmscgvjw: first marker after character 11
 How many characters need to be processed before the first start-of-packet marker is detected?
 """
 
-with open("input.txt") as f:
-    data = f.read()
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
 
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from aoc_utils.loader import MappedInput
+
+# Chunk size when reading a stream
+CHUNK_SIZE = 1 << 16
+
+# Chunk size for the vectorised search over a memory map, small enough for
+# the sort and scatter to stay in cache
+MAPPED_CHUNK_SIZE = 1 << 16
+
+START_OF_PACKET = 4
+START_OF_MESSAGE = 14
+
+
+def find_markers(chunks, sizes=(START_OF_PACKET, START_OF_MESSAGE)):
+    # Characters processed before the first window of each size with no
+    # repeats, in one O(n) pass over an iterable of byte chunks. Only the
+    # start of the repeat-free run ending at the current byte is tracked: it
+    # jumps past the previous occurrence of every byte seen again
+    pending = sorted(sizes)
+    markers = dict.fromkeys(sizes)
+
+    last_seen = [-1] * 256
+    run_start = 0
+    offset = 0
+
+    for chunk in chunks:
+        for i, byte in enumerate(chunk, offset):
+            if last_seen[byte] >= run_start:
+                run_start = last_seen[byte] + 1
+            last_seen[byte] = i
+
+            # A longer window can only complete at or after a shorter one
+            while pending and i - run_start + 1 >= pending[0]:
+                markers[pending.pop(0)] = i + 1
+
+            if not pending:
+                return markers
+
+        offset += len(chunk)
+
+    return markers
+
+
+def read_chunks(f):
+    # Lazily read a binary stream, for unbounded input
+    return iter(lambda: f.read(CHUNK_SIZE), b"")
+
+
+def run_lengths(chunk):
+    # Length of the repeat-free run ending at every byte: a stable sort by
+    # byte value lines up each occurrence with the previous one, and a
+    # running maximum of those previous indices gives where each run starts
+    order = np.argsort(chunk, kind="stable").astype(np.int32)
+
+    previous = np.empty(len(chunk), dtype=np.int32)
+    previous[order[0]] = -1
+    previous[order[1:]] = np.where(chunk[order[1:]] == chunk[order[:-1]], order[:-1], -1)
+
+    return np.arange(len(chunk), dtype=np.int32) - np.maximum.accumulate(previous)
+
+
+def find_markers_mapped(buffer, sizes=(START_OF_PACKET, START_OF_MESSAGE), chunk_size=MAPPED_CHUNK_SIZE):
+    # find_markers over a bytes-like buffer, such as a MappedInput view, or an
+    # np.memmap, one chunk of NumPy work at a time. Chunks overlap by the
+    # longest window minus one, so a window straddling a boundary is seen
+    # whole in the next chunk
+    if not isinstance(buffer, np.ndarray):
+        buffer = np.frombuffer(buffer, dtype=np.uint8)
+
+    markers = dict.fromkeys(sizes)
+    overlap = max(sizes) - 1
+
+    for start in range(0, len(buffer), chunk_size):
+        first = max(start - overlap, 0)
+        lengths = run_lengths(np.asarray(buffer[first : start + chunk_size]))
+        longest = lengths.max()
+
+        for size in sizes:
+            if markers[size] is None and longest >= size:
+                markers[size] = first + int((lengths >= size).argmax()) + 1
+
+        if None not in markers.values():
+            break
+
+    return markers
+
+
+def benchmark(path, sizes=(START_OF_PACKET, START_OF_MESSAGE)):
+    # GB/s of the streaming, vectorised and set-per-offset searches
+    size = os.path.getsize(path)
+
+    def set_slicing(path):
+        with open(path, "rb") as f:
+            data = f.read()
+
+        return {
+            k: next((i + k for i in range(len(data) - k + 1) if len(set(data[i : i + k])) == k), None)
+            for k in sizes
+        }
+
+    def streaming(path):
+        with open(path, "rb") as f:
+            return find_markers(read_chunks(f), sizes)
+
+    def mapped(path):
+        with MappedInput(path) as puzzle:
+            return find_markers_mapped(puzzle.view(), sizes)
+
+    for name, search in (("set slicing", set_slicing), ("streaming", streaming), ("numpy mmap", mapped)):
+        start = time.perf_counter()
+        markers = search(path)
+        elapsed = time.perf_counter() - start
+
+        print(f"{name:<12} {elapsed:>8.3f}s {size / elapsed / 1e9:>8.3f} GB/s  {markers}")
+
+
+def part1(data):
+    return find_markers([data.encode()], [START_OF_PACKET])[START_OF_PACKET]
 
-for i in range(0, len(data) - 4):
-    if len(set(data[i:i+4])) == 4:
-        # Part 1
-        print(i + 4)
-        break
 
 """
 Your device's communication system is correctly detecting packets, but still isn't working. It looks like it also needs to look for messages.
@@ -54,8 +174,48 @@ zcfzfwzzqfrljwzlrfnpqdbhtmscgvjw: first marker after character 26
 How many characters need to be processed before the first start-of-message marker is detected?
 """
 
-for i in range(0, len(data) - 14):
-    if len(set(data[i:i+14])) == 14:
+
+def part2(data):
+    return find_markers([data.encode()], [START_OF_MESSAGE])[START_OF_MESSAGE]
+
+
+def solve(data):
+    markers = find_markers([data.encode()])
+    return markers[START_OF_PACKET], markers[START_OF_MESSAGE]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("file", nargs="?", help="stream to search, or - for stdin")
+    parser.add_argument("--numpy", action="store_true", help="vectorised search over a memory map of the file")
+    parser.add_argument("--bench", action="store_true", help="report GB/s of each search")
+    args = parser.parse_args()
+
+    if (args.numpy or args.bench) and args.file in (None, "-"):
+        parser.error("--numpy and --bench need a file")
+
+    if args.bench:
+        benchmark(args.file)
+    elif args.numpy:
+        with MappedInput(args.file) as puzzle:
+            markers = find_markers_mapped(puzzle.view())
+
+        print(*markers.values(), sep="\n")
+    elif args.file:
+        # Stream a file, or stdin given as "-", stopping at the last marker
+        if args.file == "-":
+            markers = find_markers(read_chunks(sys.stdin.buffer))
+        else:
+            with open(args.file, "rb") as f:
+                markers = find_markers(read_chunks(f))
+
+        print(*markers.values(), sep="\n")
+    else:
+        with open("input.txt") as f:
+            data = f.read()
+
+        # Part 1
+        print(part1(data))
+
         # Part 2
-        print(i + 14)
-        break
\ No newline at end of file
+        print(part2(data))
@@ -103,58 +103,63 @@ class Dir:
                 total += f.get_total_size()
         return total
 
-curr_dir = Dir('/', None)
 
-with open('input.txt') as f:
-    lines = f.read().splitlines()
+def build_tree(data):
+    curr_dir = Dir('/', None)
 
-while lines:
-    line = lines.pop(0)
+    lines = data.splitlines()
 
-    if line.startswith('$ cd'):
-        _, _, name = line.split()
-        if name == '/':
-            while curr_dir.parent:
+    while lines:
+        line = lines.pop(0)
+
+        if line.startswith('$ cd'):
+            _, _, name = line.split()
+            if name == '/':
+                while curr_dir.parent:
+                    curr_dir = curr_dir.parent
+            elif name == '..':
                 curr_dir = curr_dir.parent
-        elif name == '..':
-            curr_dir = curr_dir.parent
-        else:
-            curr_dir = curr_dir.add_dir(name)
-    elif line.startswith('$ ls'):
-        while lines and not lines[0].startswith("$"):
-            line = lines.pop(0)
-
-            if line.startswith('dir'):
-                _, name = line.split()
-
-                curr_dir.add_dir(name)
             else:
-                size, name = line.split()
+                curr_dir = curr_dir.add_dir(name)
+        elif line.startswith('$ ls'):
+            while lines and not lines[0].startswith("$"):
+                line = lines.pop(0)
+
+                if line.startswith('dir'):
+                    _, name = line.split()
+
+                    curr_dir.add_dir(name)
+                else:
+                    size, name = line.split()
 
-                curr_dir.add_file(name, int(size))
+                    curr_dir.add_file(name, int(size))
 
-# Go to the root
-while curr_dir.parent:
-    curr_dir = curr_dir.parent
+    # Go to the root
+    while curr_dir.parent:
+        curr_dir = curr_dir.parent
 
-# Find all directories with a total size of at most 100000
-total = 0
-queue = [curr_dir]
+    return curr_dir
 
-while queue:
-    curr_dir = queue.pop(0)
 
-    if curr_dir.get_total_size() <= 100000:
-        total += curr_dir.get_total_size()
+def part1(data):
+    # Find all directories with a total size of at most 100000
+    total = 0
+    queue = [build_tree(data)]
 
-    files = curr_dir.files.values()
+    while queue:
+        curr_dir = queue.pop(0)
 
-    for f in files:
-        if isinstance(f, Dir):
-            queue.append(f)
+        if curr_dir.get_total_size() <= 100000:
+            total += curr_dir.get_total_size()
+
+        files = curr_dir.files.values()
+
+        for f in files:
+            if isinstance(f, Dir):
+                queue.append(f)
+
+    return total
 
-# Part 1
-print(total)
 
 """
 Now, you're ready to choose a directory to delete.
@@ -174,28 +179,43 @@ Directories e and a are both too small; deleting them would not free up enough s
 Find the smallest directory that, if deleted, would free up enough space on the filesystem to run the update. What is the total size of that directory?
 """
 
-# Go to the root
-while curr_dir.parent:
-    curr_dir = curr_dir.parent
-
 TOTAL_SPACE = 70000000
 SPACE_NEEDED = 30000000
-UNUSED_SPACE = TOTAL_SPACE - curr_dir.get_total_size()
-SPACE_TO_DELETE = SPACE_NEEDED - UNUSED_SPACE
 
-queue = [curr_dir]
 
-smallest_dir_size = math.inf
+def part2(data):
+    curr_dir = build_tree(data)
+
+    UNUSED_SPACE = TOTAL_SPACE - curr_dir.get_total_size()
+    SPACE_TO_DELETE = SPACE_NEEDED - UNUSED_SPACE
+
+    queue = [curr_dir]
+
+    smallest_dir_size = math.inf
+
+    while queue:
+        curr_dir = queue.pop(0)
+
+        if smallest_dir_size > curr_dir.get_total_size() >= SPACE_TO_DELETE:
+            smallest_dir_size = curr_dir.get_total_size()
+
+        for f in curr_dir.files.values():
+            if isinstance(f, Dir):
+                queue.append(f)
+
+    return smallest_dir_size
+
+
+def solve(data):
+    return part1(data), part2(data)
 
-while queue:
-    curr_dir = queue.pop(0)
 
-    if smallest_dir_size > curr_dir.get_total_size() >= SPACE_TO_DELETE:
-        smallest_dir_size = curr_dir.get_total_size()
+if __name__ == '__main__':
+    with open('input.txt') as f:
+        data = f.read()
 
-    for f in curr_dir.files.values():
-        if isinstance(f, Dir):
-            queue.append(f)
+    # Part 1
+    print(part1(data))
 
-# Part 2
-print(smallest_dir_size)
\ No newline at end of file
+    # Part 2
+    print(part2(data))
@@ -27,23 +27,33 @@ With 16 trees visible on the edge and another 5 visible in the interior, a total
 
 Consider your map; how many trees are visible from outside the grid?
 """
+
+import sys
+from pathlib import Path
+
 import numpy as np
 
-with open('input.txt') as f:
-    grid = np.array([list(map(int, line)) for line in f.read().splitlines()])
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from aoc_utils.grid import Grid
+
+DIRECTIONS = ('up', 'down', 'left', 'right')
+
 
-# Initial visible trees, grid border
-visible = np.multiply(*grid.shape) - np.multiply(grid.shape[0] - 2, grid.shape[1] - 2)
+def parse_input(data):
+    return Grid.from_text(data, mapping=Grid.DIGITS)
 
-# For each tree, check if it's visible
-for i in range(1, grid.shape[0] - 1):
-    for j in range(1, grid.shape[1] - 1):
-        # Check if it's visible
-        if np.all(grid[i, j] > grid[i, :j]) or np.all(grid[i, j] > grid[i, j+1:]) or np.all(grid[i, j] > grid[:i, j]) or np.all(grid[i, j] > grid[i+1:, j]):
-            visible += 1
 
-# Part 1
-print(visible)
+def part1(data):
+    grid = parse_input(data)
+
+    # A tree is visible if it is taller than everything between it and an edge
+    visible = np.zeros(grid.cells.shape, dtype=bool)
+    for direction in DIRECTIONS:
+        visible |= grid.cells > grid.running_max(direction)
+
+    return int(visible.sum())
+
 
 """
 Content with the amount of tree cover available, the Elves just need to know the best spot to build their tree house: they would like to be able to see a lot of trees.
@@ -81,52 +91,29 @@ This tree's scenic score is 8 (2 * 2 * 1 * 2); this is the ideal spot for the tr
 Consider each tree on your map. What is the highest scenic score possible for any tree?
 """
 
-all_scores = np.zeros(grid.shape)
-
-# For each tree, calculate the score
-for i in range(1, grid.shape[0]):
-    for j in range(1, grid.shape[1]):
-        # Calculate the score
-
-        score = 1
-        direction_count = 0
-
-        # Up
-        for k in range(i - 1, -1, -1):
-            direction_count += 1
-            if grid[k, j] >= grid[i, j]:
-                break
-        
-        score *= direction_count
-        direction_count = 0
-
-        # Bottom
-        for k in range(i + 1, grid.shape[0]):
-            direction_count += 1
-            if grid[k, j] >= grid[i, j]:
-                break
-
-        score *= direction_count
-        direction_count = 0
-
-        # Left
-        for k in range(j - 1, -1, -1):
-            direction_count += 1
-            if grid[i, k] >= grid[i, j]:
-                break
-
-        score *= direction_count
-        direction_count = 0
-        
-        # Right
-        for k in range(j + 1, grid.shape[1]):
-            direction_count += 1
-            if grid[i, k] >= grid[i, j]:
-                break
-
-        score *= direction_count
-
-        all_scores[i, j] = score
-
-# Part 2
-print(max(all_scores.flatten()))
\ No newline at end of file
+
+def part2(data):
+    grid = parse_input(data)
+
+    # Viewing distance in a direction is the distance to the first tree at
+    # least as tall, or to the edge
+    scores = np.ones(grid.cells.shape, dtype=np.int64)
+    for direction in DIRECTIONS:
+        scores *= grid.ray_distance(direction)
+
+    return int(scores.max())
+
+
+def solve(data):
+    return part1(data), part2(data)
+
+
+if __name__ == '__main__':
+    with open('input.txt') as f:
+        data = f.read()
+
+    # Part 1
+    print(part1(data))
+
+    # Part 2
+    print(part2(data))
@@ -298,20 +298,21 @@ class Board:
         return self.POSITIONS_VISITED
 
 
+def simulate(data, knots):
+    board = Board(knots)
 
-with open('input.txt', 'r') as f:
-    lines = f.read().splitlines()
+    for line in data.splitlines():
+        direction, distance = line.split()
 
-board = Board(2)
+        for _ in range(int(distance)):
+            board.move(direction)
 
-for line in lines:
-    direction, distance = line.split()
+    return board.get_num_positions_visited()
 
-    for _ in range(int(distance)):
-        board.move(direction)
 
-# Part 1
-print(board.get_num_positions_visited())
+def part1(data):
+    return simulate(data, 2)
+
 
 """
 A rope snaps! Suddenly, the river is getting a lot closer than you remember. The bridge is still there, but some of the ropes that broke are now whipping toward you as you fall through the air!
@@ -745,13 +746,21 @@ Now, the tail (9) visits 36 positions (including s) at least once:
 Simulate your complete series of motions on a larger rope with ten knots. How many positions does the tail of the rope visit at least once?
 """
 
-board = Board(10)
 
-for line in lines:
-    direction, distance = line.split()
+def part2(data):
+    return simulate(data, 10)
+
+
+def solve(data):
+    return part1(data), part2(data)
+
+
+if __name__ == '__main__':
+    with open('input.txt', 'r') as f:
+        data = f.read()
 
-    for _ in range(int(distance)):
-        board.move(direction)
+    # Part 1
+    print(part1(data))
 
-# Part 2
-print(board.get_num_positions_visited())
+    # Part 2
+    print(part2(data))
@@ -0,0 +1,35 @@
+"""
+Advent of Code Utilities
+
+Submodules, and the helpers re-exported here, are imported on first
+attribute access so that ``import aoc_utils`` stays cheap and NumPy is only
+loaded once a vectorised helper is actually used.
+"""
+
+import importlib
+
+SUBMODULES = ("bench", "cache", "graph", "grid", "loader", "profiling", "run", "utils")
+
+# Re-exported name -> submodule defining it
+EXPORTS = {
+    "Grid": "grid",
+    "MappedInput": "loader",
+    "ints": "utils",
+    "int_rows": "utils",
+}
+
+__all__ = [*SUBMODULES, *EXPORTS]
+
+
+def __getattr__(name):
+    if name in SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+
+    if name in EXPORTS:
+        return getattr(importlib.import_module(f".{EXPORTS[name]}", __name__), name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
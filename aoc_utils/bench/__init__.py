@@ -0,0 +1,101 @@
+"""
+Advent of Code Benchmarks
+
+Times every part of a day on synthetic inputs of growing size and fits the
+empirical complexity exponent ``k`` in ``time ~ n**k``.
+
+    python -m aoc_utils.bench 1,6,15
+    python -m aoc_utils.bench 20 --sizes 500,1000,2000 --repeat 3
+"""
+
+import argparse
+import math
+import random
+from typing import NamedTuple
+
+from ..run import PARTS, load_day, parse_days, time_part
+from .generators import GENERATORS, generator
+
+__all__ = ["GENERATORS", "Sample", "bench_day", "fit_exponent", "generator", "main"]
+
+
+class Sample(NamedTuple):
+    day: int
+    part: int
+    n: int
+    wall: float
+
+
+def fit_exponent(samples):
+    """Least-squares slope of log(wall) against log(n), or None if it cannot be fitted."""
+    points = [(math.log(s.n), math.log(s.wall)) for s in samples if s.wall > 0]
+
+    if len({x for x, _ in points}) < 2:
+        return None
+
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / sum(
+        (x - mean_x) ** 2 for x, _ in points
+    )
+
+
+def bench_day(day, sizes=None, seed=0, repeat=1):
+    """Yield the best of ``repeat`` wall times for each benchmarked part at each size."""
+    make_input = GENERATORS[day]
+    module = load_day(day)
+
+    for n in sizes or make_input.sizes:
+        data = make_input(n, random.Random(seed))
+
+        for part in make_input.parts:
+            func = getattr(module, PARTS[part - 1])
+            wall = min(time_part(func, data, memory=False)[1] for _ in range(repeat))
+
+            yield Sample(day, part, n, wall)
+
+
+def format_report(samples):
+    header = f"{'Day':>3}  {'Part':>4}  {'n':>10}  {'Wall (s)':>9}"
+    rows = [header, "-" * len(header)]
+
+    rows.extend(
+        f"{s.day:>3}  {s.part:>4}  {s.n:>10}  {s.wall:>9.3f}" for s in samples
+    )
+
+    rows.append("")
+
+    for day, part in sorted({(s.day, s.part) for s in samples}):
+        exponent = fit_exponent([s for s in samples if (s.day, s.part) == (day, part)])
+        fitted = "n/a" if exponent is None else f"n^{exponent:.2f}"
+        rows.append(f"Day {day} part {part}: ~ {fitted}")
+
+    return "\n".join(rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "days",
+        nargs="?",
+        type=parse_days,
+        help="days to benchmark, e.g. 1-6 or 1,6,15 (default: every generator)",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=lambda spec: [int(n) for n in spec.split(",")],
+        help="input sizes to run, overriding each generator's defaults",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--repeat", type=int, default=1, help="keep the best of this many runs"
+    )
+    args = parser.parse_args(argv)
+
+    samples = []
+
+    for day in args.days or sorted(GENERATORS):
+        samples.extend(bench_day(day, args.sizes, args.seed, args.repeat))
+
+    print(format_report(samples))
@@ -0,0 +1,469 @@
+"""
+Synthetic puzzle inputs
+
+One generator per day, each taking a size ``n`` and a ``random.Random`` and
+returning the text of a valid puzzle input that the day's ``solve`` accepts.
+What ``n`` counts is listed in each generator's docstring.
+"""
+
+import string
+from itertools import product
+
+GENERATORS = {}
+
+
+def generator(day, sizes, parts=(1, 2)):
+    """
+    Register ``func`` as the input generator for ``day``, benchmarking
+    ``parts`` at ``sizes``. Leave out a part whose work does not grow with ``n``.
+    """
+
+    def register(func):
+        func.day = day
+        func.sizes = sizes
+        func.parts = parts
+        GENERATORS[day] = func
+        return func
+
+    return register
+
+
+@generator(1, sizes=(10_000, 30_000, 100_000, 300_000))
+def day_1(n, rng):
+    """``n`` elves carrying one to five snacks each."""
+    return "\n\n".join(
+        "\n".join(str(rng.randint(1000, 60000)) for _ in range(rng.randint(1, 5)))
+        for _ in range(n)
+    )
+
+
+@generator(2, sizes=(10_000, 30_000, 100_000, 300_000))
+def day_2(n, rng):
+    """``n`` rounds of rock paper scissors."""
+    return "\n".join(f"{rng.choice('ABC')} {rng.choice('XYZ')}" for _ in range(n))
+
+
+@generator(3, sizes=(3_000, 30_000, 300_000))
+def day_3(n, rng):
+    """``n`` rucksacks, rounded up to whole groups of three."""
+    letters = string.ascii_letters
+    rucksacks = []
+
+    for _ in range(-(-n // 3)):
+        badge, *others = rng.sample(letters, len(letters))
+
+        # Each elf draws from its own 17 letters so the badge is the only
+        # item all three share
+        for pool in (others[:17], others[17:34], others[34:]):
+            common, *pool = pool
+            half = rng.randint(4, 16)
+
+            first = [common, badge] + rng.choices(pool[:8], k=half - 2)
+            second = [common] + rng.choices(pool[8:], k=half - 1)
+            rng.shuffle(first)
+            rng.shuffle(second)
+
+            rucksacks.append("".join(first + second))
+
+    return "\n".join(rucksacks)
+
+
+@generator(4, sizes=(1_000, 3_000, 10_000, 30_000))
+def day_4(n, rng):
+    """``n`` pairs of section assignments."""
+    pairs = []
+
+    for _ in range(n):
+        a, b = sorted(rng.randint(1, 99) for _ in range(2))
+        c, d = sorted(rng.randint(1, 99) for _ in range(2))
+        pairs.append(f"{a}-{b},{c}-{d}")
+
+    return "\n".join(pairs)
+
+
+@generator(5, sizes=(1_000, 3_000, 10_000, 30_000))
+def day_5(n, rng, stacks=9):
+    """``n`` moves over nine stacks that start ``n // 100 + 8`` crates tall."""
+    heights = [n // 100 + 8] * stacks
+    rows = max(heights)
+
+    drawing = [
+        " ".join(f"[{rng.choice(string.ascii_uppercase)}]" for _ in range(stacks))
+        for _ in range(rows)
+    ]
+    drawing.append(" ".join(f" {i} " for i in range(1, stacks + 1)))
+
+    moves = []
+
+    for _ in range(n):
+        # Never empty a stack so that every one has a crate on top at the end
+        from_stack = rng.choice([i for i, height in enumerate(heights) if height > 1])
+        to_stack = rng.choice([i for i in range(stacks) if i != from_stack])
+        count = rng.randint(1, min(heights[from_stack] - 1, 30))
+
+        heights[from_stack] -= count
+        heights[to_stack] += count
+        moves.append(f"move {count} from {from_stack + 1} to {to_stack + 1}")
+
+    return "\n".join(drawing) + "\n\n" + "\n".join(moves)
+
+
+@generator(6, sizes=(100_000, 300_000, 1_000_000, 3_000_000))
+def day_6(n, rng):
+    """A stream of ``n`` characters whose only markers are at the very end."""
+    # Three letters can never form a start-of-packet marker
+    body = "".join(rng.choices("abc", k=max(n - 14, 0)))
+    return body + "".join(rng.sample("defghijklmnopqrstuvwxyz", 14))
+
+
+@generator(7, sizes=(1_000, 3_000, 10_000))
+def day_7(n, rng):
+    """A terminal session exploring ``n`` directories totalling about 45M."""
+    children = [[] for _ in range(n)]
+
+    # Random recursive tree, so the depth stays around log(n)
+    for node in range(1, n):
+        children[rng.randrange(node)].append(node)
+
+    lines = ["$ cd /"]
+    stack = [(0, None)]
+
+    while stack:
+        node, command = stack.pop()
+
+        if command is not None:
+            lines.append(command)
+            if node is None:
+                continue
+
+        lines.append("$ ls")
+        lines.extend(f"dir d{child}" for child in children[node])
+        lines.extend(
+            f"{rng.randint(1, 45_000_000 // n)} f{i}.txt" for i in range(rng.randint(0, 4))
+        )
+
+        for child in reversed(children[node]):
+            stack.append((None, "$ cd .."))
+            stack.append((child, f"$ cd d{child}"))
+
+    return "\n".join(lines)
+
+
+@generator(8, sizes=(25, 50, 100))
+def day_8(n, rng):
+    """An ``n`` by ``n`` grid of tree heights."""
+    return "\n".join(
+        "".join(rng.choices(string.digits, k=n)) for _ in range(n)
+    )
+
+
+@generator(9, sizes=(500, 1_000, 2_000, 4_000))
+def day_9(n, rng):
+    """``n`` head motions of up to nine steps."""
+    return "\n".join(f"{rng.choice('UDLR')} {rng.randint(1, 9)}" for _ in range(n))
+
+
+@generator(10, sizes=(10_000, 30_000, 100_000))
+def day_10(n, rng):
+    """A program of ``n`` instructions."""
+    return "\n".join(
+        "noop" if rng.random() < 0.3 else f"addx {rng.randint(-20, 20)}"
+        for _ in range(n)
+    )
+
+
+@generator(11, sizes=(50, 100, 200))
+def day_11(n, rng, monkeys=8):
+    """Eight monkeys holding ``n`` items between them."""
+    primes = [2, 3, 5, 7, 11, 13, 17, 19]
+    items = [[] for _ in range(monkeys)]
+
+    for _ in range(n):
+        items[rng.randrange(monkeys)].append(str(rng.randint(50, 99)))
+
+    operations = ["old * old", "old * 19", "old * 7"] + [
+        f"old + {rng.randint(1, 8)}" for _ in range(monkeys - 3)
+    ]
+    rng.shuffle(operations)
+
+    notes = []
+
+    for i in range(monkeys):
+        is_true, is_false = rng.sample([j for j in range(monkeys) if j != i], 2)
+        notes.append(
+            f"Monkey {i}:\n"
+            f"  Starting items: {', '.join(items[i])}\n"
+            f"  Operation: new = {operations[i]}\n"
+            f"  Test: divisible by {primes[i]}\n"
+            f"    If true: throw to monkey {is_true}\n"
+            f"    If false: throw to monkey {is_false}"
+        )
+
+    return "\n\n".join(notes)
+
+
+@generator(12, sizes=(30, 40, 60))
+def day_12(n, rng):
+    """An ``n`` by ``4n`` heightmap climbing a column at a time to a plateau."""
+    width = 4 * n
+    rows = []
+
+    for _ in range(n):
+        row = [
+            string.ascii_lowercase[col] if col < 26 else rng.choice("yz")
+            for col in range(width)
+        ]
+        rows.append(row)
+
+    rows[0][0] = "S"
+    rows[rng.randrange(n)][-1] = "E"
+
+    return "\n".join("".join(row) for row in rows)
+
+
+@generator(13, sizes=(300, 1_000, 3_000))
+def day_13(n, rng):
+    """``n`` pairs of nested packets."""
+
+    def packet(depth=0):
+        return [
+            rng.randint(0, 10) if depth > 2 or rng.random() < 0.6 else packet(depth + 1)
+            for _ in range(rng.randint(0, 5))
+        ]
+
+    return "\n\n".join(
+        f"{packet()}\n{packet()}".replace(" ", "") for _ in range(n)
+    )
+
+
+@generator(14, sizes=(10, 30, 100))
+def day_14(n, rng):
+    """``n`` rock paths above a ledge 160 deep that catches the part 1 sand."""
+    paths = ["440,160 -> 560,160"]
+
+    for _ in range(n - 1):
+        x, y = rng.randint(450, 550), rng.randint(10, 160)
+        points = [(x, y)]
+
+        for _ in range(rng.randint(1, 5)):
+            if rng.random() < 0.5:
+                x = min(max(x + rng.randint(-8, 8), 400), 600)
+            else:
+                y = min(max(y + rng.randint(-8, 8), 5), 160)
+            points.append((x, y))
+
+        paths.append(" -> ".join(f"{x},{y}" for x, y in points))
+
+    return "\n".join(paths)
+
+
+@generator(15, sizes=(10, 30, 100, 300))
+def day_15(n, rng):
+    """
+    ``n`` sensors leaving exactly one gap in the search area.
+
+    Four huge sensors touch the hidden beacon's diagonals and cover every
+    other point; the rest sit strictly inside one of them. The gap is kept in
+    the first few thousand rows so that part 2 stays quick to benchmark.
+    """
+    x, y = rng.randint(0, 4_000_000), rng.randint(0, 2_000)
+    half = 4_000_001
+    radius = 2 * half - 1
+
+    big = [(x - half, y - half), (x + half, y + half), (x - half, y + half), (x + half, y - half)]
+    sensors = [(sx, sy, radius) for sx, sy in big]
+
+    for _ in range(max(n - 4, 0)):
+        sx, sy = rng.choice(big)
+        r = rng.randint(1, 1_000_000)
+        slack = radius - r
+        dx = rng.randint(-slack, slack)
+        dy = rng.randint(-(slack - abs(dx)), slack - abs(dx))
+        sensors.append((sx + dx, sy + dy, r))
+
+    rng.shuffle(sensors)
+
+    return "\n".join(
+        f"Sensor at x={sx}, y={sy}: closest beacon is at x={sx + r}, y={sy}"
+        for sx, sy, r in sensors
+    )
+
+
+@generator(16, sizes=(15, 30, 60))
+def day_16(n, rng, working=8):
+    """``n`` valves in a connected network, eight of them with a working flow."""
+    names = ["AA"] + rng.sample(
+        [a + b for a, b in product(string.ascii_uppercase, repeat=2) if a + b != "AA"],
+        n - 1,
+    )
+    tunnels = {name: set() for name in names}
+
+    for i in range(1, n):
+        # Attach to an earlier valve to stay connected, then add a shortcut
+        for other in {names[rng.randrange(i)], rng.choice(names)} - {names[i]}:
+            tunnels[names[i]].add(other)
+            tunnels[other].add(names[i])
+
+    flowing = set(rng.sample(names[1:], min(working, n - 1)))
+
+    lines = []
+
+    for name in names:
+        rate = rng.randint(2, 25) if name in flowing else 0
+        leads = sorted(tunnels[name])
+        if len(leads) == 1:
+            lines.append(
+                f"Valve {name} has flow rate={rate}; tunnel leads to valve {leads[0]}"
+            )
+        else:
+            lines.append(
+                f"Valve {name} has flow rate={rate}; tunnels lead to valves {', '.join(leads)}"
+            )
+
+    return "\n".join(lines)
+
+
+@generator(17, sizes=(50, 100, 200))
+def day_17(n, rng):
+    """A jet pattern ``n`` pushes long."""
+    return "".join(rng.choices("<>", k=n))
+
+
+@generator(18, sizes=(1_000, 2_000, 4_000))
+def day_18(n, rng):
+    """``n`` distinct droplet cubes packed into a box with room for pockets."""
+    side = max(int((2 * n) ** (1 / 3)) + 1, 3)
+    cubes = rng.sample(list(product(range(1, side + 1), repeat=3)), n)
+    return "\n".join(f"{x},{y},{z}" for x, y, z in cubes)
+
+
+# Part 2 only ever reads the first three blueprints, at about 35 s each, so
+# its time does not depend on n and only part 1 is benchmarked
+@generator(19, sizes=(2, 4, 8), parts=(1,))
+def day_19(n, rng):
+    """``n`` robot factory blueprints."""
+    return "\n".join(
+        f"Blueprint {i}: Each ore robot costs {rng.randint(2, 4)} ore. "
+        f"Each clay robot costs {rng.randint(2, 4)} ore. "
+        f"Each obsidian robot costs {rng.randint(2, 4)} ore and {rng.randint(5, 20)} clay. "
+        f"Each geode robot costs {rng.randint(2, 4)} ore and {rng.randint(5, 20)} obsidian."
+        for i in range(1, n + 1)
+    )
+
+
+# Sizes avoid divisors of 1000, which would make every grove coordinate the zero
+@generator(20, sizes=(300, 700, 1_500))
+def day_20(n, rng):
+    """An encrypted file of ``n`` numbers containing a single zero."""
+    numbers = [rng.choice([-1, 1]) * rng.randint(1, 10_000) for _ in range(n - 1)]
+    numbers.insert(rng.randrange(n), 0)
+    return "\n".join(map(str, numbers))
+
+
+@generator(21, sizes=(1_000, 3_000, 10_000))
+def day_21(n, rng):
+    """
+    About ``n`` monkeys forming an expression tree of depth O(log n).
+
+    The solver evaluates the tree recursively, so the depth has to stay far
+    below the recursion limit. The humn branch is a chain of about
+    ``log2(n)`` operations whose other operands, like root's other side, are
+    balanced sums and differences of constants. The humn side of root shrinks
+    as humn grows and divides exactly at the generated answer, which is what
+    the part 2 bisection relies on.
+    """
+    # root and humn have fixed jobs and must never be drawn for another monkey
+    names = iter(
+        rng.sample(
+            [
+                name
+                for name in map("".join, product(string.ascii_lowercase, repeat=4))
+                if name not in ("root", "humn")
+            ],
+            n + 100,
+        )
+    )
+    jobs = {}
+
+    def constant(value, size=1):
+        # A balanced subtree of at most size monkeys that evaluates to value
+        name = next(names)
+
+        if size < 3:
+            jobs[name] = str(value)
+            return name
+
+        half = (size - 1) // 2
+        part = rng.randint(1, 10**6)
+
+        if rng.random() < 0.5:
+            jobs[name] = f"{constant(value - part, half)} + {constant(part, size - 1 - half)}"
+        else:
+            jobs[name] = f"{constant(value + part, half)} - {constant(part, size - 1 - half)}"
+
+        return name
+
+    chain = max(n.bit_length(), 1)
+    budget = max(n // (chain + 1), 1)
+
+    answer = rng.randint(1, 10**6)
+    value, name, increasing = answer, "humn", True
+    jobs["humn"] = str(rng.randint(1, 10**6))
+
+    for _ in range(chain):
+        c = rng.randint(1, 20)
+        ops = ["+", "-", "r-"] + ["*"] * (abs(value) < 10**9) + ["/"] * (value % c == 0)
+        op = rng.choice(ops)
+
+        parent = next(names)
+
+        operand = constant(c, budget)
+
+        if op == "r-":
+            jobs[parent] = f"{operand} - {name}"
+            value, increasing = c - value, not increasing
+        else:
+            jobs[parent] = f"{name} {op} {operand}"
+            value = {"+": value + c, "-": value - c, "*": value * c, "/": value // c}[op]
+
+        name = parent
+
+    if increasing:
+        parent = next(names)
+        jobs[parent] = f"{constant(0)} - {name}"
+        value, name = -value, parent
+
+    jobs["root"] = f"{name} + {constant(value, budget)}"
+
+    lines = [f"{monkey}: {job}" for monkey, job in jobs.items()]
+    rng.shuffle(lines)
+
+    return "\n".join(lines)
+
+
+@generator(22, sizes=(50, 100, 200))
+def day_22(n, rng):
+    """A board folding into a cube of side ``n``, walked by 2000 instructions."""
+    #  .12
+    #  .3.
+    #  54.
+    #  6..
+    layout = [".##", ".#.", "##.", "#.."]
+    rows = []
+
+    for pattern in layout:
+        for _ in range(n):
+            row = "".join(
+                "".join(rng.choices(".#", weights=(9, 1), k=n)) if face == "#" else " " * n
+                for face in pattern
+            )
+            rows.append(row.rstrip())
+
+    # The walk starts on the leftmost open tile of the top row
+    rows[0] = " " * n + "." + rows[0][n + 1 :]
+
+    path = "".join(
+        f"{rng.randint(1, 2 * n)}{rng.choice('LR')}" for _ in range(1999)
+    ) + str(rng.randint(1, 2 * n))
+
+    return "\n".join(rows) + "\n\n" + path
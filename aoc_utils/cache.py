@@ -0,0 +1,104 @@
+"""
+Advent of Code Result Cache
+
+Answers and timings are kept in ``.aoc_cache/runs.sqlite3``, keyed by the
+SHA-256 of the puzzle input and of the day's ``solve.py`` together with the
+``aoc_utils`` modules it may import. Unchanged days are answered straight
+from the cache, and every fresh run is appended to the timing history so
+regressions show up as a per-day trend.
+"""
+
+import hashlib
+import sqlite3
+import time
+from pathlib import Path
+
+CACHE_DIR = Path(__file__).resolve().parent.parent / ".aoc_cache"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS answers (
+    day INTEGER NOT NULL,
+    part INTEGER NOT NULL,
+    input_hash TEXT NOT NULL,
+    source_hash TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    PRIMARY KEY (day, part, input_hash, source_hash)
+);
+
+CREATE TABLE IF NOT EXISTS timings (
+    day INTEGER NOT NULL,
+    part INTEGER NOT NULL,
+    input_hash TEXT NOT NULL,
+    source_hash TEXT NOT NULL,
+    wall REAL NOT NULL,
+    cpu REAL NOT NULL,
+    peak INTEGER NOT NULL,
+    recorded_at REAL NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS timings_by_part ON timings (day, part, recorded_at);
+"""
+
+
+def sha256(data):
+    if isinstance(data, str):
+        data = data.encode()
+    return hashlib.sha256(data).hexdigest()
+
+
+class ResultCache:
+    def __init__(self, path=CACHE_DIR / "runs.sqlite3"):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        self.db = sqlite3.connect(path)
+        self.db.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.db.close()
+
+    def lookup(self, day, part, input_hash, source_hash):
+        """Return ``(answer, wall, cpu, peak)`` from the latest matching run, or None."""
+        row = self.db.execute(
+            """
+            SELECT answer, wall, cpu, peak
+            FROM answers JOIN timings USING (day, part, input_hash, source_hash)
+            WHERE day = ? AND part = ? AND input_hash = ? AND source_hash = ?
+            ORDER BY recorded_at DESC
+            LIMIT 1
+            """,
+            (day, part, input_hash, source_hash),
+        ).fetchone()
+
+        return row
+
+    def store(self, result, input_hash, source_hash):
+        """Record a fresh ``PartResult``; answers are stored as text."""
+        key = (result.day, result.part, input_hash, source_hash)
+
+        with self.db:
+            self.db.execute(
+                "INSERT OR REPLACE INTO answers VALUES (?, ?, ?, ?, ?)",
+                (*key, str(result.answer)),
+            )
+            self.db.execute(
+                "INSERT INTO timings VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (*key, result.wall, result.cpu, result.peak, time.time()),
+            )
+
+    def history(self, day, part):
+        """Every recorded ``(recorded_at, source_hash, wall)`` for a part, oldest first."""
+        return self.db.execute(
+            """
+            SELECT recorded_at, source_hash, wall
+            FROM timings
+            WHERE day = ? AND part = ?
+            ORDER BY recorded_at
+            """,
+            (day, part),
+        ).fetchall()
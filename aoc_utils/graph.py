@@ -0,0 +1,240 @@
+"""
+Advent of Code Graph Search
+
+Breadth-first, Dijkstra and A* search over integer node ids ``0..n-1``. A
+graph is either a ``CSR`` adjacency (built with ``to_csr`` or, for grids,
+``lattice_graph``/``grid_graph``) or a callback returning a node's
+neighbours, for implicit graphs too large or irregular to build up front.
+
+Searches return ``Paths(distance, predecessor)``: a distance per node and,
+when asked for, the node each one was reached from (-1 for sources and
+unreached nodes). BFS distances are integers with ``UNREACHED`` (-1) for
+nodes it never got to; Dijkstra and A* distances are floats with ``inf``.
+"""
+
+import heapq
+import math
+from collections import deque
+from typing import NamedTuple
+
+import numpy as np
+
+UNREACHED = -1
+
+
+class CSR(NamedTuple):
+    indptr: np.ndarray
+    indices: np.ndarray
+    weights: np.ndarray = None
+
+    @property
+    def n(self):
+        return len(self.indptr) - 1
+
+
+class Paths(NamedTuple):
+    distance: np.ndarray
+    predecessor: np.ndarray = None
+
+
+def to_csr(sources, targets, n, weights=None):
+    """Compressed sparse row adjacency from parallel edge arrays."""
+    sources = np.asarray(sources, dtype=np.int64)
+    targets = np.asarray(targets, dtype=np.int64)
+
+    order = np.argsort(sources, kind="stable")
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(sources, minlength=n), out=indptr[1:])
+
+    if weights is not None:
+        weights = np.asarray(weights)[order]
+
+    return CSR(indptr, targets[order], weights)
+
+
+def lattice_graph(values, inside, offsets, allowed=None):
+    """
+    CSR adjacency of a flattened, padded lattice of any dimension: node ``i``
+    links to ``i + offset`` for every offset landing on an ``inside`` node for
+    which ``allowed(values[i], values[i + offset])`` holds (element-wise over
+    arrays). The padding keeps every ``i + offset`` in range.
+    """
+    nodes = np.flatnonzero(inside)
+    sources, targets = [], []
+
+    for offset in offsets:
+        neighbours = nodes + offset
+        mask = inside[neighbours]
+        if allowed is not None:
+            mask &= allowed(values[nodes], values[neighbours])
+
+        sources.append(nodes[mask])
+        targets.append(neighbours[mask])
+
+    return to_csr(np.concatenate(sources), np.concatenate(targets), len(inside))
+
+
+def grid_graph(grid, allowed=None, diagonal=False):
+    """``lattice_graph`` of a ``Grid``; node ids are its flat indices."""
+    names = grid.offsets if diagonal else ("up", "down", "left", "right")
+    offsets = [grid.offsets[name] for name in names]
+    return lattice_graph(grid.flat, grid.inside, offsets, allowed)
+
+
+def path(predecessor, target):
+    """Nodes from the search's source to ``target``, following predecessors."""
+    nodes = [target]
+    while predecessor[nodes[-1]] != -1:
+        nodes.append(int(predecessor[nodes[-1]]))
+
+    return nodes[::-1]
+
+
+def _sources(sources):
+    return [int(source) for source in np.atleast_1d(sources)]
+
+
+def _expand(graph, frontier):
+    """Every ``(parent, child)`` edge out of ``frontier``, as two arrays."""
+    starts = graph.indptr[frontier]
+    counts = graph.indptr[frontier + 1] - starts
+
+    parents = np.repeat(frontier, counts)
+    positions = np.repeat(starts - np.cumsum(counts) + counts, counts)
+    positions += np.arange(len(parents))
+
+    return parents, graph.indices[positions]
+
+
+def _bfs_csr(graph, sources, target, predecessors):
+    distance = np.full(graph.n, UNREACHED, dtype=np.int64)
+    predecessor = np.full(graph.n, -1, dtype=np.int64) if predecessors else None
+
+    frontier = np.unique(sources)
+    distance[frontier] = 0
+
+    # Expand a whole level at a time
+    level = 0
+    while len(frontier) and (target is None or distance[target] == UNREACHED):
+        level += 1
+
+        parents, children = _expand(graph, frontier)
+        new = distance[children] == UNREACHED
+        frontier, first = np.unique(children[new], return_index=True)
+
+        distance[frontier] = level
+        if predecessors:
+            predecessor[frontier] = parents[new][first]
+
+    return Paths(distance, predecessor)
+
+
+def _bfs_callback(neighbours, n, sources, target, predecessors):
+    distance = [UNREACHED] * n
+    predecessor = [-1] * n
+
+    for source in sources:
+        distance[source] = 0
+
+    queue = deque(sources)
+    while queue:
+        node = queue.popleft()
+        if node == target:
+            break
+
+        for neighbour in neighbours(node):
+            if distance[neighbour] == UNREACHED:
+                distance[neighbour] = distance[node] + 1
+                predecessor[neighbour] = node
+                queue.append(neighbour)
+
+    return Paths(
+        np.array(distance, dtype=np.int64),
+        np.array(predecessor, dtype=np.int64) if predecessors else None,
+    )
+
+
+def bfs(graph, sources, target=None, n=None, predecessors=False):
+    """
+    Unweighted shortest paths from one or many ``sources``. Stops once
+    ``target`` is reached, if given. A callback graph maps a node to its
+    neighbours and needs the node count ``n``.
+    """
+    sources = _sources(sources)
+
+    if isinstance(graph, CSR):
+        return _bfs_csr(graph, np.array(sources, dtype=np.int64), target, predecessors)
+
+    return _bfs_callback(graph, n, sources, target, predecessors)
+
+
+def _weighted(graph):
+    """A ``node -> [(neighbour, weight), ...]`` callback for any graph."""
+    if not isinstance(graph, CSR):
+        return graph
+
+    # Plain lists are much faster than NumPy scalars in the search loop
+    indptr, indices = graph.indptr.tolist(), graph.indices.tolist()
+    weights = graph.weights.tolist() if graph.weights is not None else [1] * len(indices)
+
+    return lambda node: zip(
+        indices[indptr[node] : indptr[node + 1]],
+        weights[indptr[node] : indptr[node + 1]],
+    )
+
+
+def _best_first(graph, sources, target, n, heuristic, predecessors):
+    n = graph.n if isinstance(graph, CSR) else n
+    neighbours = _weighted(graph)
+
+    distance = [math.inf] * n
+    predecessor = [-1] * n
+
+    heap = []
+    for source in sources:
+        distance[source] = 0
+        heap.append((heuristic(source), 0, source))
+    heapq.heapify(heap)
+
+    while heap:
+        _, cost, node = heapq.heappop(heap)
+
+        # Skip entries superseded by a cheaper path. There is no closed set:
+        # with an inconsistent heuristic a node can be popped before its best
+        # path is found, and must then be expanded again
+        if cost > distance[node]:
+            continue
+
+        if node == target:
+            break
+
+        for neighbour, weight in neighbours(node):
+            cost = distance[node] + weight
+            if cost < distance[neighbour]:
+                distance[neighbour] = cost
+                predecessor[neighbour] = node
+                heapq.heappush(heap, (cost + heuristic(neighbour), cost, neighbour))
+
+    return Paths(
+        np.array(distance, dtype=np.float64),
+        np.array(predecessor, dtype=np.int64) if predecessors else None,
+    )
+
+
+def dijkstra(graph, sources, target=None, n=None, predecessors=False):
+    """
+    Weighted shortest paths from one or many ``sources``. A CSR graph without
+    weights counts every edge as 1; a callback graph maps a node to
+    ``(neighbour, weight)`` pairs and needs the node count ``n``.
+    """
+    return _best_first(graph, _sources(sources), target, n, lambda node: 0, predecessors)
+
+
+def astar(graph, sources, target, heuristic, n=None, predecessors=False):
+    """
+    Dijkstra guided towards ``target`` by an admissible ``heuristic(node)``,
+    one that never overestimates the remaining distance. It need not be
+    consistent: nodes reached again by a cheaper path are expanded again.
+    Only the distance to ``target`` is guaranteed to be final.
+    """
+    return _best_first(graph, _sources(sources), target, n, heuristic, predecessors)
@@ -0,0 +1,168 @@
+"""
+Advent of Code Grid
+
+A dense 2D grid stored row-major in one contiguous NumPy buffer with a border
+of padding cells. Cells are addressed by flat index, so a neighbour is just
+``index + offset`` and walks stop on the padding instead of bounds checks.
+"""
+
+import numpy as np
+
+# (row, col) steps
+DIRECTIONS = {
+    "up": (-1, 0),
+    "down": (1, 0),
+    "left": (0, -1),
+    "right": (0, 1),
+}
+
+DIAGONALS = {
+    "up-left": (-1, -1),
+    "up-right": (-1, 1),
+    "down-left": (1, -1),
+    "down-right": (1, 1),
+}
+
+
+def _oriented(cells, direction):
+    """
+    View ``cells`` so that looking ``direction`` from a cell means looking
+    towards lower indices along axis 1.
+    """
+    if direction == "left":
+        return cells
+    if direction == "right":
+        return cells[:, ::-1]
+    if direction == "up":
+        return cells.T
+    if direction == "down":
+        return cells[::-1].T
+    raise ValueError(f"unknown direction {direction!r}")
+
+
+class Grid:
+
+    DIGITS = {str(digit): digit for digit in range(10)}
+
+    def __init__(self, cells, pad=1, fill=0):
+        cells = np.asarray(cells)
+
+        self.height, self.width = cells.shape
+        self.pad = pad
+        self.fill = fill
+        self.stride = self.width + 2 * pad
+
+        self.padded = np.full(
+            (self.height + 2 * pad, self.stride), fill, dtype=cells.dtype
+        )
+        self.cells = self.padded[pad : pad + self.height, pad : pad + self.width]
+        self.cells[...] = cells
+
+        # Flat views share memory with ``padded`` and ``cells``
+        self.flat = self.padded.reshape(-1)
+        self.inside = np.zeros(self.padded.shape, dtype=bool)
+        self.inside[pad : pad + self.height, pad : pad + self.width] = True
+        self.inside = self.inside.reshape(-1)
+
+        self.offsets = {
+            name: row * self.stride + col
+            for name, (row, col) in {**DIRECTIONS, **DIAGONALS}.items()
+        }
+
+    @classmethod
+    def from_text(cls, text, mapping=None, pad=1, fill=0, dtype=np.int64):
+        """
+        Build a grid from lines of text, one cell per character. Ragged lines
+        are padded with spaces. Without a ``mapping`` (str -> value) cells hold
+        the raw byte values.
+        """
+        lines = text.splitlines()
+        width = max(map(len, lines))
+        raw = np.frombuffer(
+            "".join(line.ljust(width) for line in lines).encode(), dtype=np.uint8
+        ).reshape(len(lines), width)
+
+        if mapping is None:
+            return cls(raw.astype(dtype), pad, fill)
+
+        table = np.full(256, -1, dtype=np.int64)
+        for char, value in mapping.items():
+            table[ord(char)] = value
+
+        cells = table[raw]
+        if (cells == -1).any() and -1 not in mapping.values():
+            unknown = sorted({chr(byte) for byte in raw[cells == -1].tolist()})
+            raise ValueError(f"characters without a mapping: {unknown}")
+
+        return cls(cells.astype(dtype), pad, fill)
+
+    def __str__(self):
+        return f"Grid {self.height}x{self.width}"
+
+    def index(self, row, col):
+        """Flat index of the cell at ``(row, col)``."""
+        return (row + self.pad) * self.stride + col + self.pad
+
+    def position(self, index):
+        """``(row, col)`` of a flat index."""
+        row, col = divmod(index, self.stride)
+        return row - self.pad, col - self.pad
+
+    def indices(self):
+        """Flat indices of every cell, row-major."""
+        return np.flatnonzero(self.inside)
+
+    def neighbours(self, diagonal=False):
+        """
+        Neighbour table: row ``i`` holds the flat indices around the ``i``-th
+        cell of ``indices()``. Border cells point into the padding, which holds
+        ``fill``, so no bounds checks are needed.
+        """
+        names = [*DIRECTIONS, *DIAGONALS] if diagonal else [*DIRECTIONS]
+        steps = np.array([self.offsets[name] for name in names])
+        return self.indices()[:, None] + steps[None, :]
+
+    def ray(self, index, direction):
+        """Yield the flat indices from ``index`` (exclusive) to the grid edge."""
+        step = self.offsets[direction]
+        index += step
+
+        while self.inside[index]:
+            yield index
+            index += step
+
+    def running_max(self, direction, initial=-1):
+        """
+        For every cell, the largest value strictly beyond it in ``direction``,
+        or ``initial`` for cells on that edge.
+        """
+        result = np.empty(self.cells.shape, dtype=self.cells.dtype)
+        cells, out = _oriented(self.cells, direction), _oriented(result, direction)
+
+        out[:, 0] = initial
+        out[:, 1:] = np.maximum.accumulate(cells, axis=1)[:, :-1]
+
+        return result
+
+    def ray_distance(self, direction):
+        """
+        For every cell, the number of steps in ``direction`` to the first cell
+        at least as large as it, or to the edge if there is none.
+
+        Vectorised per distinct value, so meant for small value ranges such as
+        digits.
+        """
+        result = np.empty(self.cells.shape, dtype=np.int64)
+        cells, out = _oriented(self.cells, direction), _oriented(result, direction)
+        steps = np.arange(cells.shape[1])
+
+        for value in np.unique(cells):
+            # Position of the nearest earlier cell >= value, 0 (the edge) if none
+            blockers = np.maximum.accumulate(np.where(cells >= value, steps, 0), axis=1)
+            nearest = np.zeros_like(blockers)
+            nearest[:, 1:] = blockers[:, :-1]
+
+            mask = cells == value
+            out[mask] = (steps - nearest)[mask]
+
+        return result
@@ -0,0 +1,109 @@
+"""
+Memory-mapped puzzle input
+
+Maps ``input.txt`` read-only and hands out ``memoryview`` slices of it, so
+lines and blank-line separated blocks can be walked without copying the file
+into Python strings. Decode a view with ``str(view, "ascii")`` only when the
+text is actually needed.
+
+    with MappedInput("Day 1/input.txt") as puzzle:
+        for block in puzzle.blocks():
+            ...
+
+Views point straight into the mapping: drop them before the ``with`` block
+ends, otherwise closing the map raises ``BufferError``. Files with CRLF line
+endings are detected from their first line, and blocks are then split on
+``\r\n\r\n``.
+"""
+
+import mmap
+
+NEWLINE = b"\n"
+CRLF = b"\r\n"
+
+
+class MappedInput:
+    def __init__(self, path):
+        self.path = path
+
+        with open(path, "rb") as f:
+            try:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be mapped
+                self._map = b""
+
+        self._view = memoryview(self._map)
+
+        # The line ending used throughout, judged by the first line
+        first = self._map.find(NEWLINE)
+        self.newline = CRLF if first > 0 and self._map[first - 1 : first] == b"\r" else NEWLINE
+        self.blank_line = self.newline * 2
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc_info):
+        try:
+            self.close()
+        except BufferError:
+            # The traceback of an exception raised inside the block can still
+            # hold views; let that exception through and leave the map to the
+            # garbage collector
+            if exc_type is None:
+                raise
+
+    def close(self):
+        self._view.release()
+
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+
+    def __len__(self):
+        return len(self._map)
+
+    def __getitem__(self, index):
+        return self._view[index]
+
+    def view(self, start=0, stop=None):
+        return self._view[start:stop]
+
+    def find(self, sub, start=0, stop=None):
+        """Index of the first ``sub`` in ``[start, stop)``, or -1."""
+        return self._map.find(sub, start, len(self._map) if stop is None else stop)
+
+    def text(self, encoding="ascii"):
+        """Materialise the whole input as a ``str``."""
+        return str(self._map[:], encoding)
+
+    def split(self, separator):
+        """Lazily yield the views between occurrences of ``separator``."""
+        start, size = 0, len(self._map)
+
+        if not size:
+            return
+
+        # A trailing newline would otherwise yield an empty last item
+        if self._map[-len(self.newline) :] == self.newline:
+            size -= len(self.newline)
+
+        while start <= size:
+            stop = self._map.find(separator, start, size)
+            if stop == -1:
+                stop = size
+
+            yield self._view[start:stop]
+
+            start = stop + len(separator)
+
+    def lines(self):
+        """Lazily yield each line, without its newline, as a ``memoryview``."""
+        for line in self.split(NEWLINE):
+            # Tolerate CRLF inputs
+            if line[-1:] == b"\r":
+                line = line[:-1]
+            yield line
+
+    def blocks(self):
+        """Lazily yield each blank-line separated block as a ``memoryview``."""
+        return self.split(self.blank_line)
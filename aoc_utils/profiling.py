@@ -0,0 +1,248 @@
+"""
+Advent of Code Profiling Hooks
+
+Wraps a part's ``func(data)`` call in one of three profilers, writes the raw
+profile next to the other run artefacts and returns a top-N summary:
+
+    cprofile     deterministic call profile, saved as a pstats ``.prof``
+    tracemalloc  allocations live at the part's peak by call stack, saved as
+                 a collapsed-stack file weighted in bytes
+    sample       wall-clock stack sampling from a background thread, saved as
+                 a collapsed-stack file weighted in samples
+
+Collapsed-stack files hold one ``outer;...;inner weight`` line per stack and
+can be fed straight to ``flamegraph.pl`` or speedscope.
+"""
+
+import cProfile
+import pstats
+import sys
+import threading
+import tracemalloc
+from collections import Counter
+from functools import cache
+from pathlib import Path
+
+PROFILE_DIR = Path(__file__).resolve().parent.parent / ".aoc_cache" / "profiles"
+
+# The GIL switch interval is lowered to this while sampling, otherwise the
+# sampling thread only gets to run every 5ms
+SAMPLE_INTERVAL = 0.001
+
+# Traced memory must grow by this factor over the last snapshot for a new
+# one; each snapshot copies every trace, so taking one per byte is too slow
+PEAK_GROWTH = 1.1
+
+OWN_FRAME = f"({Path(__file__).parent.name}/{Path(__file__).name}:"
+
+
+def short_path(filename, lineno):
+    path = Path(filename)
+    return f"{path.parent.name}/{path.name}:{lineno}"
+
+
+@cache
+def frame_label(code, lineno=None):
+    return f"{code.co_name} ({short_path(code.co_filename, lineno or code.co_firstlineno)})"
+
+
+def write_collapsed(path, stacks):
+    with open(path, "w") as f:
+        for stack, weight in stacks.most_common():
+            f.write(f"{';'.join(stack)} {weight}\n")
+
+
+def profile_cprofile(func, data, path, top):
+    profiler = cProfile.Profile()
+    answer = profiler.runcall(func, data)
+
+    path = path.with_suffix(".prof")
+    profiler.dump_stats(path)
+
+    stats = pstats.Stats(profiler).stats
+    hottest = sorted(stats.items(), key=lambda item: item[1][2], reverse=True)[:top]
+
+    summary = [
+        f"{tottime:>9.3f}s own {cumtime:>9.3f}s cum {calls:>10} calls  "
+        # Built-ins are reported with a "~" filename
+        + (name if filename == "~" else f"{name} ({short_path(filename, lineno)})")
+        for (filename, lineno, name), (_, calls, tottime, cumtime, _) in hottest
+    ]
+
+    return answer, path, summary
+
+
+class PeakSnapshotter:
+    """
+    Snapshot ``tracemalloc`` from a background thread whenever traced memory
+    reaches a new high, so the allocations behind a part's peak are kept
+    even if they are freed before it returns.
+    """
+
+    def __init__(self, interval=SAMPLE_INTERVAL, growth=PEAK_GROWTH):
+        self.interval = interval
+        self.growth = growth
+        self.snapshot = None
+        self.size = 0
+        self._overhead = 0
+        self._stop = threading.Event()
+
+    def __enter__(self):
+        self._switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(self.interval)
+
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+
+        sys.setswitchinterval(self._switch_interval)
+
+        # The peak may come at the very end, e.g. a large answer
+        self.check()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    def check(self):
+        # Snapshots are traced too; leave out what the current one holds
+        current = tracemalloc.get_traced_memory()[0] - self._overhead
+        if current <= self.size * self.growth and self.snapshot is not None:
+            return
+
+        self.snapshot = None
+        before = tracemalloc.get_traced_memory()[0]
+        self.snapshot = tracemalloc.take_snapshot()
+        self._overhead = tracemalloc.get_traced_memory()[0] - before
+        self.size = before
+
+
+def profile_tracemalloc(func, data, path, top):
+    tracemalloc.start(64)
+
+    try:
+        with PeakSnapshotter() as snapshotter:
+            answer = func(data)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    snapshot = snapshotter.snapshot.filter_traces(
+        [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            # Anything the snapshot thread itself allocated
+            tracemalloc.Filter(False, threading.__file__, all_frames=True),
+            tracemalloc.Filter(False, __file__),
+        ]
+    )
+
+    stacks = Counter()
+    for stat in snapshot.statistics("traceback"):
+        # Tracebacks are root first, as collapsed stacks want; keep only the
+        # frames below the profiled call
+        frames = list(stat.traceback)
+        own = [depth for depth, frame in enumerate(frames) if frame.filename == __file__]
+        if own:
+            del frames[: own[-1] + 1]
+
+        stack = tuple(short_path(frame.filename, frame.lineno) for frame in frames)
+        stacks[stack] += stat.size
+
+    path = path.with_suffix(".collapsed")
+    write_collapsed(path, stacks)
+
+    summary = [
+        f"peak {peak / 1024:.1f} KiB; live at the largest snapshot "
+        f"({snapshotter.size / 1024:.1f} KiB traced):"
+    ]
+    summary.extend(
+        f"{stat.size / 1024:>12.1f} KiB {stat.count:>10} blocks  "
+        f"{short_path(stat.traceback[0].filename, stat.traceback[0].lineno)}"
+        for stat in snapshot.statistics("lineno")[:top]
+    )
+
+    return answer, path, summary
+
+
+class StackSampler:
+    """Periodically record the call stack of the thread that entered it."""
+
+    def __init__(self, interval=SAMPLE_INTERVAL):
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = threading.Event()
+
+    def __enter__(self):
+        self._target = threading.get_ident()
+        self._switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(self.interval)
+
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+
+        sys.setswitchinterval(self._switch_interval)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._target)
+
+            stack = []
+            while frame is not None:
+                stack.append(frame_label(frame.f_code, frame.f_lineno))
+                frame = frame.f_back
+
+            # Keep only the frames below the profiled call, innermost first
+            for depth, label in enumerate(stack):
+                if OWN_FRAME in label:
+                    del stack[depth:]
+                    break
+
+            # Skip the sample if the profiled call returned meanwhile
+            if stack and not self._stop.is_set():
+                self.stacks[tuple(reversed(stack))] += 1
+
+
+def profile_sample(func, data, path, top):
+    with StackSampler() as sampler:
+        answer = func(data)
+
+    path = path.with_suffix(".collapsed")
+    write_collapsed(path, sampler.stacks)
+
+    total = sum(sampler.stacks.values()) or 1
+    own = Counter()
+    for stack, samples in sampler.stacks.items():
+        # Attribute samples to the innermost function, ignoring its line
+        own[stack[-1].rsplit(":", 1)[0] + ")"] += samples
+
+    summary = [
+        f"{samples:>8} samples {samples / total:>6.1%}  {label}"
+        for label, samples in own.most_common(top)
+    ]
+
+    return answer, path, summary
+
+
+PROFILERS = {
+    "cprofile": profile_cprofile,
+    "tracemalloc": profile_tracemalloc,
+    "sample": profile_sample,
+}
+
+
+def profile_part(kind, func, data, name, top=10, out_dir=PROFILE_DIR):
+    """
+    Run ``func(data)`` under the ``kind`` profiler and write its profile to
+    ``out_dir/name.<ext>``. Returns ``(answer, path, summary_lines)``.
+    """
+    Path(out_dir).mkdir(parents=True, exist_ok=True)
+    return PROFILERS[kind](func, data, Path(out_dir) / name, top)
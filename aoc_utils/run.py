@@ -0,0 +1,293 @@
+"""
+Advent of Code Runner
+
+Loads every ``Day N/solve.py`` as a module and times each of its parts.
+
+    python -m aoc_utils.run 1-22
+    python -m aoc_utils.run 1,3,15-16 --no-memory
+    python -m aoc_utils.run 1-22 --jobs 1
+    python -m aoc_utils.run 15-20 --history
+    python -m aoc_utils.run 17 --profile=sample
+
+Parts run in a process pool sized to the machine; each worker is handed the
+already-read input text rather than opening ``input.txt`` itself. Parts whose
+input, ``solve.py`` and ``aoc_utils`` modules are unchanged since the last run
+are answered from ``.aoc_cache`` (marked ``*``) unless ``--no-cache`` is
+given. With ``--profile`` each part instead runs once in this process under
+the chosen profiler (see ``aoc_utils.profiling``).
+"""
+
+import argparse
+import importlib.util
+import os
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
+from pathlib import Path
+from typing import NamedTuple
+
+from .cache import ResultCache, sha256
+from .profiling import PROFILERS, profile_part
+
+ROOT = Path(__file__).resolve().parent.parent
+DAYS = range(1, 26)
+PARTS = ("part1", "part2")
+
+
+class PartResult(NamedTuple):
+    day: int
+    part: int
+    answer: object
+    wall: float
+    cpu: float
+    peak: int
+    cached: bool = False
+
+
+def parse_days(spec):
+    """Turn a spec such as ``"1-5,8"`` into a sorted list of day numbers."""
+    days = set()
+
+    for chunk in spec.split(","):
+        start, _, stop = chunk.partition("-")
+        days.update(range(int(start), int(stop or start) + 1))
+
+    return sorted(days)
+
+
+def day_path(day):
+    return ROOT / f"Day {day}"
+
+
+def available_days():
+    return [day for day in DAYS if (day_path(day) / "solve.py").exists()]
+
+
+@cache
+def load_day(day):
+    """Import ``Day N/solve.py`` without running its ``__main__`` block."""
+    spec = importlib.util.spec_from_file_location(
+        f"day_{day}", day_path(day) / "solve.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+
+    # Registered so that its functions pickle by name for worker processes
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@cache
+def library_source():
+    """Every ``aoc_utils`` module, since days import its helpers."""
+    return b"".join(path.read_bytes() for path in sorted(Path(__file__).parent.glob("*.py")))
+
+
+def source_hash(day):
+    return sha256((day_path(day) / "solve.py").read_bytes() + library_source())
+
+
+def read_input(day):
+    with open(day_path(day) / "input.txt") as f:
+        return f.read()
+
+
+def time_part(func, data, memory=True):
+    """Call ``func(data)`` and return its answer, wall time, CPU time and peak bytes."""
+    if memory:
+        tracemalloc.start()
+
+    wall, cpu = time.perf_counter(), time.process_time()
+
+    try:
+        answer = func(data)
+    finally:
+        wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+
+        peak = 0
+        if memory:
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+    return answer, wall, cpu, peak
+
+
+def run_part(day, part, data, memory=True):
+    func = getattr(load_day(day), PARTS[part - 1])
+    return PartResult(day, part, *time_part(func, data, memory))
+
+
+def run_day(day, data=None, memory=True):
+    if data is None:
+        data = read_input(day)
+
+    return [run_part(day, part, data, memory) for part in range(1, len(PARTS) + 1)]
+
+
+def run_tasks(tasks, jobs=None):
+    if jobs == 1:
+        return [run_part(*task) for task in tasks]
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [executor.submit(run_part, *task) for task in tasks]
+        return [future.result() for future in futures]
+
+
+def run_days(days, jobs=None, memory=True, cache=None, use_cached=True):
+    """
+    Run every part of ``days``, fanning the parts out over ``jobs`` processes.
+
+    With a ``ResultCache``, fresh results are recorded in it and, if
+    ``use_cached`` is set, parts it already has answers for are not rerun.
+    """
+    inputs = {day: read_input(day) for day in days}
+    keys = {day: (sha256(inputs[day]), source_hash(day)) for day in days}
+
+    results = {}
+    tasks = []
+
+    for day in days:
+        for part in range(1, len(PARTS) + 1):
+            hit = cache.lookup(day, part, *keys[day]) if cache and use_cached else None
+
+            if hit:
+                results[day, part] = PartResult(day, part, *hit, cached=True)
+            else:
+                tasks.append((day, part, inputs[day], memory))
+
+    for result in run_tasks(tasks, jobs):
+        results[result.day, result.part] = result
+
+        if cache:
+            cache.store(result, *keys[result.day])
+
+    return [results[key] for key in sorted(results)]
+
+
+def format_table(results):
+    header = f"{'Day':>3}  {'Part':>4}  {'Answer':<20}  {'Wall (s)':>9}  {'CPU (s)':>9}  {'Peak (KiB)':>10}"
+    rows = [header, "-" * len(header)]
+
+    for result in results:
+        marker = "*" if result.cached else " "
+        lines = str(result.answer).splitlines()
+        # Multi-line answers (e.g. the Day 10 CRT) are printed below their row
+        first, rest = (lines[0], []) if len(lines) == 1 else ("", lines)
+
+        rows.append(
+            f"{result.day:>3}  {result.part:>4}  {first:<20}  {result.wall:>9.3f}  "
+            f"{result.cpu:>9.3f}  {result.peak / 1024:>10.1f} {marker}"
+        )
+        rows.extend(f"{'':>11}{line}" for line in rest)
+
+    return "\n".join(rows)
+
+
+def format_history(cache, days):
+    header = f"{'Day':>3}  {'Part':>4}  {'Runs':>4}  {'First (s)':>9}  {'Best (s)':>9}  {'Latest (s)':>10}  {'Change':>7}  Source"
+    rows = [header, "-" * len(header)]
+
+    for day in days:
+        for part in range(1, len(PARTS) + 1):
+            history = cache.history(day, part)
+            if not history:
+                continue
+
+            walls = [wall for _, _, wall in history]
+            first, latest = walls[0], walls[-1]
+            change = (latest - first) / first if first else 0
+
+            rows.append(
+                f"{day:>3}  {part:>4}  {len(walls):>4}  {first:>9.3f}  {min(walls):>9.3f}  "
+                f"{latest:>10.3f}  {change:>+7.1%}  {history[-1][1][:8]}"
+            )
+
+    return "\n".join(rows)
+
+
+def profile_days(days, kind, top=10):
+    for day in days:
+        data = read_input(day)
+
+        for part, name in enumerate(PARTS, start=1):
+            func = getattr(load_day(day), name)
+            _, path, summary = profile_part(kind, func, data, f"day{day:02}_part{part}", top)
+
+            print(f"Day {day} part {part} ({kind}, written to {path})")
+            print("\n".join(f"  {line}" for line in summary), end="\n\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "days",
+        nargs="?",
+        type=parse_days,
+        help="days to run, e.g. 1-22 or 1,3,15-16 (default: every solved day)",
+    )
+    parser.add_argument(
+        "--no-memory",
+        dest="memory",
+        action="store_false",
+        help="skip tracemalloc, which slows allocation-heavy days down",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count(),
+        help="worker processes, 1 runs everything in this process (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        dest="use_cached",
+        action="store_false",
+        help="rerun every part even if its answer is cached (timings are still recorded)",
+    )
+    parser.add_argument(
+        "--history",
+        action="store_true",
+        help="print the recorded timing trend for each part instead of running",
+    )
+    parser.add_argument(
+        "--profile",
+        choices=PROFILERS,
+        help="profile each part in-process and write a profile per part",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=10,
+        help="hot spots to list per part when profiling (default: %(default)s)",
+    )
+    args = parser.parse_args(argv)
+
+    days = args.days or available_days()
+
+    if args.profile:
+        profile_days(days, args.profile, args.top)
+        return
+
+    with ResultCache() as cache:
+        if args.history:
+            print(format_history(cache, days))
+            return
+
+        makespan = time.perf_counter()
+        results = run_days(days, args.jobs, args.memory, cache, args.use_cached)
+        makespan = time.perf_counter() - makespan
+
+    # Cached parts did not run, so they are left out of the speedup
+    total = sum(result.wall for result in results if not result.cached)
+
+    print(format_table(results))
+
+    print(f"\nSum of part wall times: {total:.3f}s")
+    print(f"Makespan ({args.jobs} jobs): {makespan:.3f}s")
+    print(f"Parallel speedup: {total / makespan:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
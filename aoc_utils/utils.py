@@ -3,6 +3,10 @@ Advent of Code Utility Functions
 """
 
 import re
+from array import array
+
+ZERO, NINE, MINUS = ord("0"), ord("9"), ord("-")
+
 
 def ints_line(line):
     digits = r'\d+'
@@ -11,6 +15,71 @@ def ints_line(line):
 
 def ints_file(f):
     return [ints_line(line) for line in f]
-    
 
-print(ints_file(open('test.txt', 'r')))
\ No newline at end of file
+
+def _as_bytes(buffer):
+    if isinstance(buffer, str):
+        return buffer.encode()
+    return buffer
+
+
+def ints(buffer, dtype=None):
+    """
+    Every integer in ``buffer`` (str, bytes, mmap, ...) in a single pass.
+
+    A ``-`` directly before a number makes it negative unless the ``-`` itself
+    follows a digit, so ``x=-5`` gives -5 but ``2-4`` gives 2 and 4.
+
+    The scan is vectorised with NumPy, with no Python-level loop per number.
+    Returns a flat NumPy array of ``dtype``, or an ``array('q')`` when no
+    ``dtype`` is given. Numbers must fit in 18 digits, so that they cannot
+    overflow int64; longer ones raise ``ValueError``. NumPy is imported on
+    first use so that importing this module stays cheap.
+    """
+    import numpy as np
+
+    if dtype is None:
+        values = array("q")
+        values.frombytes(ints(buffer, np.int64).tobytes())
+        return values
+
+    raw = np.frombuffer(_as_bytes(buffer), dtype=np.uint8)
+    is_digit = (raw >= ZERO) & (raw <= NINE)
+
+    # +1 where a run of digits starts, -1 just past where it ends
+    edges = np.diff(is_digit.view(np.int8), prepend=np.int8(0), append=np.int8(0))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+
+    if not len(starts):
+        return np.empty(0, dtype=dtype)
+
+    lengths = ends - starts
+    if lengths.max() > 18:
+        raise ValueError(f"numbers longer than 18 digits would overflow: {lengths.max()} digits")
+
+    digit_index = np.flatnonzero(is_digit)
+    place = np.repeat(ends - 1, lengths) - digit_index
+
+    digits = (raw[digit_index] - ZERO).astype(np.int64)
+    values = np.add.reduceat(digits * 10**place, np.cumsum(lengths) - lengths)
+
+    before = np.maximum(starts - 1, 0)
+    negative = (starts > 0) & (raw[before] == MINUS)
+    negative &= ~((starts > 1) & is_digit[np.maximum(starts - 2, 0)])
+    values[negative] *= -1
+
+    return values.astype(dtype, copy=False)
+
+
+def int_rows(buffer, width, dtype="int64"):
+    """
+    Integers in ``buffer`` as an ``(n, width)`` array, for inputs with a fixed
+    number of integers per line such as Day 15 (4) or Day 18 (3).
+    """
+    values = ints(buffer, dtype)
+
+    if len(values) % width:
+        raise ValueError(f"{len(values)} integers do not split into rows of {width}")
+
+    return values.reshape(-1, width)
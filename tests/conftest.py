@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Tests import aoc_utils from the repository root without installing it
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,35 @@
+from aoc_utils.cache import ResultCache, sha256
+from aoc_utils.run import PartResult
+
+
+def result(answer, wall):
+    return PartResult(day=3, part=1, answer=answer, wall=wall, cpu=wall, peak=1024)
+
+
+def test_store_and_lookup(tmp_path):
+    input_hash, source_hash = sha256("input"), sha256(b"source")
+
+    with ResultCache(tmp_path / "runs.sqlite3") as cache:
+        assert cache.lookup(3, 1, input_hash, source_hash) is None
+
+        cache.store(result(7889, 0.5), input_hash, source_hash)
+        cache.store(result(7889, 0.25), input_hash, source_hash)
+
+        # Answers come back as text, with the latest timings
+        assert cache.lookup(3, 1, input_hash, source_hash) == ("7889", 0.25, 0.25, 1024)
+        assert cache.lookup(3, 1, input_hash, sha256("changed")) is None
+        assert cache.lookup(3, 2, input_hash, source_hash) is None
+
+
+def test_history_is_oldest_first_and_persists(tmp_path):
+    path = tmp_path / "nested" / "runs.sqlite3"
+
+    with ResultCache(path) as cache:
+        cache.store(result(1, 0.3), "input", "old")
+        cache.store(result(1, 0.1), "input", "new")
+
+    with ResultCache(path) as cache:
+        history = cache.history(3, 1)
+
+    assert [(source, wall) for _, source, wall in history] == [("old", 0.3), ("new", 0.1)]
+    assert history[0][0] <= history[1][0]
@@ -0,0 +1,54 @@
+import io
+import random
+
+import pytest
+
+from aoc_utils.bench.generators import day_1
+from aoc_utils.run import load_day
+
+day = load_day(1)
+
+INVENTORIES = [
+    "1000\n2000\n3000\n\n4000\n\n5000\n6000\n\n7000\n8000\n9000\n\n10000",
+    "10\n\n\n5\n5\n",
+    "\n5\n6",
+    "1\r\n2\r\n\r\n3\r\n",
+    "7",
+    "",
+    "\n\n",
+]
+
+
+@pytest.mark.parametrize("inventory", INVENTORIES)
+def test_array_totals_match_streaming(inventory):
+    expected = list(day.elf_totals(io.StringIO(inventory)))
+    assert day.elf_totals_array(inventory).tolist() == expected
+
+
+def test_top_totals_match_sort():
+    inventory = day_1(2000, random.Random(0))
+    totals = sorted(day.elf_totals(io.StringIO(inventory)), reverse=True)
+
+    for k in (1, 3, 10, len(totals) + 5):
+        assert day.top_totals(day.elf_totals_array(inventory), k) == totals[:k]
+        assert day.top_calories(io.StringIO(inventory), k) == totals[:k]
+
+
+def test_parallel_matches_streaming(tmp_path):
+    path = tmp_path / "inventory.txt"
+    path.write_text(day_1(5000, random.Random(1)))
+
+    with open(path, "rb") as f:
+        expected = day.top_calories(f, 5)
+
+    assert day.parallel_top_calories(path, 5, jobs=1, chunk_size=1000) == expected
+    assert day.parallel_top_calories(path, 5, jobs=2, chunk_size=1000) == expected
+
+
+def test_chunks_end_on_crlf_blank_lines(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_bytes(b"1\r\n2\r\n\r\n3\r\n\r\n4\r\n5\r\n")
+
+    bounds = day.chunk_bounds(path, chunk_size=1)
+    assert bounds == [(0, 8), (8, 13), (13, 19)]
+    assert day.parallel_top_calories(path, 3, jobs=1, chunk_size=1) == [9, 3, 3]
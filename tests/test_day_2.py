@@ -0,0 +1,51 @@
+import random
+
+import pytest
+
+from aoc_utils.bench.generators import day_2
+from aoc_utils.run import load_day
+
+day = load_day(2)
+
+
+def brute_force(data, strategy):
+    return sum(strategy[tuple(line.split())] for line in data.splitlines() if line.strip())
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        "A Y\nB X\nC Z",
+        "A Y\nB X\nC Z\n",
+        "A Y\r\nB X\r\nC Z\r\n",
+        "A Y\n\nB X\nC Z\n\n",
+        day_2(5000, random.Random(0)),
+    ],
+)
+def test_scores_match_brute_force(data):
+    expected = (brute_force(data, day.outcomes), brute_force(data, day.new_outcomes))
+    assert day.solve(data) == expected
+
+
+@pytest.mark.parametrize("data", ["A Y\nB", "A Q\nB X", "AY\nBX"])
+def test_malformed_rounds_are_rejected(data):
+    with pytest.raises(ValueError):
+        day.parse_input(data)
+
+
+def test_tournament_scores_every_strategy(tmp_path):
+    data = day_2(1000, random.Random(1))
+    path = tmp_path / "rounds.txt"
+    path.write_text(data)
+
+    always_rock = {(opponent, you): 1 for opponent in "ABC" for you in "XYZ"}
+    tournament = day.Tournament({"outcomes": day.outcomes, "new_outcomes": day.new_outcomes})
+    tournament.add("always_rock", always_rock)
+
+    expected = {
+        "outcomes": brute_force(data, day.outcomes),
+        "new_outcomes": brute_force(data, day.new_outcomes),
+        "always_rock": 1000,
+    }
+    assert tournament.score(data) == expected
+    assert tournament.score_file(path) == expected
@@ -0,0 +1,49 @@
+import random
+
+import pytest
+
+from aoc_utils.bench.generators import day_3
+from aoc_utils.run import load_day
+
+day = load_day(3)
+
+EXAMPLE = """vJrwpWtwJgWrhcsFMMfFFhFp
+jqHRNqRjqzjGDLGLrsFMfFZSrLrFZsSL
+PmmdzqPrVvPwwTWBwg
+wMqvLMZHhHMvwLHjbvcjnnSBnvTQFn
+ttgJtRGJQctTZtZT
+CrZsJsPPZsGzwwsLwLmpwMDw"""
+
+
+def brute_force(data):
+    rucksacks = data.split()
+    compartments = sum(
+        day.get_priority((set(r[: len(r) // 2]) & set(r[len(r) // 2 :])).pop()) for r in rucksacks
+    )
+    badges = sum(
+        day.get_priority((set(a) & set(b) & set(c)).pop())
+        for a, b, c in zip(rucksacks[::3], rucksacks[1::3], rucksacks[2::3])
+    )
+    return compartments, badges
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        EXAMPLE,
+        EXAMPLE + "\n",
+        EXAMPLE.replace("\n", "\r\n"),
+        EXAMPLE.replace("\n", " \n") + "\n\n",
+        day_3(3000, random.Random(0)),
+    ],
+)
+def test_all_paths_match_brute_force(data):
+    expected = brute_force(data)
+
+    assert day.vectorised_priorities(data) == expected
+    assert day.rucksack_priorities(data.encode().splitlines(keepends=True)) == expected
+
+
+def test_unknown_items_are_rejected():
+    with pytest.raises(ValueError):
+        day.vectorised_priorities(EXAMPLE + "1")
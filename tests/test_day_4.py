@@ -0,0 +1,53 @@
+import random
+
+import numpy as np
+import pytest
+
+from aoc_utils.bench.generators import day_4
+from aoc_utils.run import load_day
+
+day = load_day(4)
+
+EXAMPLE = "2-4,6-8\n2-3,4-5\n5-7,7-9\n2-8,3-7\n6-6,4-6\n2-6,4-8"
+
+
+def sections(start, end):
+    return set(range(start, end + 1))
+
+
+@pytest.mark.parametrize("data", [EXAMPLE, day_4(2000, random.Random(0))])
+def test_pair_counts_match_sets(data):
+    contained = overlapping = 0
+    for line in data.splitlines():
+        a, b, c, d = map(int, line.replace(",", "-").split("-"))
+        first, second = sections(a, b), sections(c, d)
+        contained += first <= second or second <= first
+        overlapping += bool(first & second)
+
+    assert day.pair_counts(data) == (contained, overlapping)
+    assert day.solve(data) == (contained, overlapping)
+
+
+def test_coverage_index_matches_brute_force():
+    intervals = day.parse_input(day_4(500, random.Random(1))).reshape(-1, 2)
+    index = day.CoverageIndex(intervals)
+
+    depth = {
+        section: sum(start <= section <= end for start, end in intervals.tolist())
+        for section in range(0, 101)
+    }
+    assert index.coverage(np.arange(0, 101)).tolist() == list(depth.values())
+
+    deepest = max(depth.values())
+    assert index.max_depth() == (deepest, min(s for s, d in depth.items() if d == deepest))
+
+
+def test_empty_index():
+    index = day.CoverageIndex([])
+    assert len(index) == 0
+    assert index.max_depth() == (0, None)
+
+
+def test_benchmark_checks_the_index(capsys):
+    day.benchmark(day_4(300, random.Random(2)), queries=50)
+    assert "max depth" in capsys.readouterr().out
@@ -0,0 +1,96 @@
+import random
+
+import pytest
+
+from aoc_utils.bench.generators import day_5
+from aoc_utils.run import load_day
+
+day = load_day(5)
+
+EXAMPLE = """    [D]    
+[N] [C]    
+[Z] [M] [P]
+ 1   2   3 
+
+move 1 from 2 to 1
+move 3 from 1 to 3
+move 2 from 2 to 1
+move 1 from 1 to 2"""
+
+
+def brute_force(data, keep_order):
+    # One crate at a time, through a buffer for the CrateMover 9001
+    stacks, moves = day.parse_input(data)
+    stacks = [stack.copy() for stack in stacks]
+
+    for count, from_stack, to_stack in moves.tolist():
+        lifted = [stacks[from_stack].pop() for _ in range(count)]
+        stacks[to_stack].extend(reversed(lifted) if keep_order else lifted)
+
+    return "".join(stack[-1] for stack in stacks[1:])
+
+
+def test_example():
+    assert day.solve(EXAMPLE) == ("CMZ", "MCD")
+
+
+@pytest.mark.parametrize("rope", [False, True])
+@pytest.mark.parametrize("keep_order", [False, True])
+@pytest.mark.parametrize(
+    "data",
+    [
+        EXAMPLE,
+        EXAMPLE + "\nmove 0 from 1 to 2",
+        day_5(2000, random.Random(0)),
+    ],
+)
+def test_cranes_match_brute_force(data, keep_order, rope):
+    stacks, moves = day.parse_input(data)
+    assert day.run_crane(stacks, moves, keep_order, rope) == brute_force(data, keep_order)
+
+
+def test_moving_nothing_leaves_stacks_alone():
+    stacks = [[], ["A", "B"], ["C"]]
+    day.move_crates(stacks, 0, 1, 2, keep_order=False)
+    assert stacks == [[], ["A", "B"], ["C"]]
+
+    first, second = day.RopeStack("AB"), day.RopeStack("C")
+    first.move_to(second, 0, keep_order=False)
+    assert (list(first), list(second)) == (["A", "B"], ["C"])
+
+
+def test_rope_stacks_match_lists():
+    rng = random.Random(3)
+    lists = [list(range(i * 100, i * 100 + 40)) for i in range(4)]
+    ropes = [day.RopeStack(stack) for stack in lists]
+
+    for _ in range(500):
+        source, target = rng.sample(range(4), 2)
+        count = rng.randint(0, len(lists[source]))
+        keep_order = rng.random() < 0.5
+
+        lists.insert(0, [])
+        day.move_crates(lists, count, source + 1, target + 1, keep_order)
+        lists.pop(0)
+        ropes[source].move_to(ropes[target], count, keep_order)
+
+        assert [list(rope) for rope in ropes] == lists
+        assert [len(rope) for rope in ropes] == [len(stack) for stack in lists]
+
+    assert [rope.top() for rope in ropes if len(rope)] == [stack[-1] for stack in lists if stack]
+
+
+@pytest.mark.parametrize("n", [0, 1, 2, 1000])
+def test_rope_stack_builds_a_treap(n):
+    stack = day.RopeStack(range(n))
+    assert list(stack) == list(range(n))
+    assert len(stack) == n
+
+    # Heap-ordered priorities and consistent sizes at every node
+    pending = [stack.root] if stack.root else []
+    while pending:
+        rope = pending.pop()
+        children = [child for child in (rope.left, rope.right) if child]
+        assert all(child.priority < rope.priority for child in children)
+        assert rope.size == 1 + sum(child.size for child in children)
+        pending.extend(children)
@@ -0,0 +1,50 @@
+import random
+
+import numpy as np
+import pytest
+
+from aoc_utils.bench.generators import day_6
+from aoc_utils.run import load_day
+
+day = load_day(6)
+
+SIZES = (day.START_OF_PACKET, day.START_OF_MESSAGE)
+
+
+def brute_force(data, size):
+    return next((i + size for i in range(len(data) - size + 1) if len(set(data[i : i + size])) == size), None)
+
+
+def random_stream(rng, n):
+    # Few letters so that repeat-free windows are rare and land anywhere
+    return "".join(rng.choices("abcdefghijklmno", k=n))
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        "mjqjpqmgbljsphdztnvjfqwrcgsmlb",
+        "nznrnfrfntjfmvfwmzdfjlvtqnbhcprsg",
+        "aaaa",
+        "",
+        random_stream(random.Random(0), 5000),
+        day_6(20_000, random.Random(1)),
+    ],
+)
+def test_searches_match_brute_force(data):
+    expected = {size: brute_force(data, size) for size in SIZES}
+    raw = data.encode()
+
+    assert day.find_markers([raw]) == expected
+    assert day.find_markers([raw[i : i + 7] for i in range(0, len(raw), 7)]) == expected
+    for chunk_size in (16, 1000, day.MAPPED_CHUNK_SIZE):
+        assert day.find_markers_mapped(raw, chunk_size=chunk_size) == expected
+
+
+def test_mapped_search_over_a_memory_map(tmp_path):
+    data = day_6(100_000, random.Random(2))
+    path = tmp_path / "input.txt"
+    path.write_text(data)
+
+    mapped = day.find_markers_mapped(np.memmap(path, dtype=np.uint8, mode="r"), chunk_size=4096)
+    assert mapped == {size: brute_force(data, size) for size in SIZES}
@@ -0,0 +1,19 @@
+import random
+
+import pytest
+
+from aoc_utils.bench import GENERATORS, bench_day
+from aoc_utils.run import load_day
+
+
+@pytest.mark.parametrize("day", sorted(GENERATORS))
+def test_smallest_input_solves(day):
+    make_input = GENERATORS[day]
+    data = make_input(min(make_input.sizes), random.Random(0))
+
+    assert load_day(day).part1(data) is not None
+
+
+def test_bench_times_only_the_listed_parts():
+    samples = list(bench_day(19, sizes=[1]))
+    assert [sample.part for sample in samples] == [1]
@@ -0,0 +1,136 @@
+import math
+import random
+from collections import deque
+
+import numpy as np
+import pytest
+
+from aoc_utils.graph import CSR, UNREACHED, astar, bfs, dijkstra, grid_graph, path, to_csr
+from aoc_utils.grid import Grid
+
+
+def random_edges(rng, n, count):
+    sources = [rng.randrange(n) for _ in range(count)]
+    targets = [rng.randrange(n) for _ in range(count)]
+    weights = [rng.randint(1, 9) for _ in range(count)]
+    return sources, targets, weights
+
+
+def adjacency(sources, targets, weights, n):
+    edges = [[] for _ in range(n)]
+    for source, target, weight in zip(sources, targets, weights):
+        edges[source].append((target, weight))
+    return edges
+
+
+def simple_bfs(edges, sources):
+    distance = [UNREACHED] * len(edges)
+    queue = deque(sources)
+    for source in sources:
+        distance[source] = 0
+
+    while queue:
+        node = queue.popleft()
+        for neighbour, _ in edges[node]:
+            if distance[neighbour] == UNREACHED:
+                distance[neighbour] = distance[node] + 1
+                queue.append(neighbour)
+    return distance
+
+
+def bellman_ford(edges, sources):
+    distance = [math.inf] * len(edges)
+    for source in sources:
+        distance[source] = 0
+
+    for _ in range(len(edges)):
+        for node, neighbours in enumerate(edges):
+            for neighbour, weight in neighbours:
+                distance[neighbour] = min(distance[neighbour], distance[node] + weight)
+    return distance
+
+
+@pytest.fixture(params=range(3))
+def graph(request):
+    rng = random.Random(request.param)
+    n = 60
+    sources, targets, weights = random_edges(rng, n, 150)
+    return to_csr(sources, targets, n, weights), adjacency(sources, targets, weights, n)
+
+
+@pytest.mark.parametrize("sources", [0, [0, 7, 7, 30]])
+def test_bfs_matches_simple_bfs(graph, sources):
+    csr, edges = graph
+    expected = simple_bfs(edges, np.atleast_1d(sources).tolist())
+
+    assert bfs(csr, sources).distance.tolist() == expected
+
+    callback = lambda node: [neighbour for neighbour, _ in edges[node]]
+    assert bfs(callback, sources, n=len(edges)).distance.tolist() == expected
+
+
+def test_bfs_paths_follow_edges(graph):
+    csr, edges = graph
+    result = bfs(csr, 0, predecessors=True)
+
+    for target in np.flatnonzero(result.distance > 0):
+        nodes = path(result.predecessor, int(target))
+        assert nodes[0] == 0 and nodes[-1] == target
+        assert len(nodes) - 1 == result.distance[target]
+        for node, neighbour in zip(nodes, nodes[1:]):
+            assert neighbour in [next_node for next_node, _ in edges[node]]
+
+
+def test_dijkstra_matches_bellman_ford(graph):
+    csr, edges = graph
+    expected = bellman_ford(edges, [0])
+
+    assert dijkstra(csr, 0).distance.tolist() == expected
+    assert dijkstra(lambda node: edges[node], 0, n=len(edges)).distance.tolist() == expected
+
+
+def test_unweighted_dijkstra_matches_bfs(graph):
+    csr, _ = graph
+    unweighted = CSR(csr.indptr, csr.indices)
+
+    reached = bfs(unweighted, 0).distance
+    expected = np.where(reached == UNREACHED, np.inf, reached)
+    assert dijkstra(unweighted, 0).distance.tolist() == expected.tolist()
+
+
+def test_astar_on_a_grid():
+    text = "\n".join(
+        "".join("#" if (row * 5 + col * 3) % 7 == 0 and (row, col) != (0, 0) else "." for col in range(12))
+        for row in range(9)
+    )
+    grid = Grid.from_text(text, mapping={".": 0, "#": 1}, fill=1)
+    graph = grid_graph(grid, allowed=lambda here, there: there == 0)
+
+    start, end = grid.index(0, 0), grid.index(8, 11)
+    end_row, end_col = grid.position(end)
+
+    def manhattan(node):
+        row, col = grid.position(node)
+        return abs(row - end_row) + abs(col - end_col)
+
+    result = astar(graph, start, end, manhattan, predecessors=True)
+    expected = bfs(graph, start).distance[end]
+
+    if expected == UNREACHED:
+        assert result.distance[end] == math.inf
+    else:
+        assert result.distance[end] == expected
+        assert len(path(result.predecessor, end)) - 1 == expected
+
+
+def test_astar_with_an_inconsistent_heuristic():
+    # Admissible but inconsistent: h(a) = 4 steers the search through b,
+    # which reaches c at cost 3 before the cheaper a -> c path is seen
+    s, a, b, c, g = range(5)
+    graph = to_csr([s, s, b, a, c], [a, b, c, c, g], 5, weights=[1, 1, 2, 1, 3])
+    heuristic = {s: 0, a: 4, b: 0, c: 0, g: 0}.get
+
+    result = astar(graph, s, g, heuristic, predecessors=True)
+
+    assert result.distance[g] == 5
+    assert path(result.predecessor, g) == [s, a, c, g]
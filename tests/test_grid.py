@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+from aoc_utils.grid import DIRECTIONS, Grid
+
+EXAMPLE = "30373\n25512\n65332\n33549\n35390"
+
+STEPS = {"up": (-1, 0), "down": (1, 0), "left": (0, -1), "right": (0, 1)}
+
+
+def walk(cells, row, col, direction):
+    """Values from ``(row, col)`` (exclusive) to the edge, nearest first."""
+    d_row, d_col = STEPS[direction]
+    row, col = row + d_row, col + d_col
+
+    values = []
+    while 0 <= row < len(cells) and 0 <= col < len(cells[0]):
+        values.append(cells[row][col])
+        row, col = row + d_row, col + d_col
+    return values
+
+
+@pytest.fixture(params=[EXAMPLE, "\n".join("".join(str((r * 7 + c * 3) % 10) for c in range(9)) for r in range(6))])
+def grid(request):
+    return Grid.from_text(request.param, mapping=Grid.DIGITS)
+
+
+@pytest.mark.parametrize("direction", DIRECTIONS)
+def test_running_max_matches_loops(grid, direction):
+    cells = grid.cells.tolist()
+    expected = [
+        [max(walk(cells, row, col, direction), default=-1) for col in range(grid.width)]
+        for row in range(grid.height)
+    ]
+    assert grid.running_max(direction).tolist() == expected
+
+
+@pytest.mark.parametrize("direction", DIRECTIONS)
+def test_ray_distance_matches_loops(grid, direction):
+    cells = grid.cells.tolist()
+
+    def distance(row, col):
+        values = walk(cells, row, col, direction)
+        blocked = [step for step, value in enumerate(values, 1) if value >= cells[row][col]]
+        return blocked[0] if blocked else len(values)
+
+    expected = [[distance(row, col) for col in range(grid.width)] for row in range(grid.height)]
+    assert grid.ray_distance(direction).tolist() == expected
+
+
+def test_indexing_round_trips(grid):
+    for index in grid.indices():
+        row, col = grid.position(index)
+        assert grid.index(row, col) == index
+        assert grid.flat[index] == grid.cells[row, col]
+
+
+def test_neighbours_and_rays(grid):
+    neighbours = grid.neighbours()
+    cells = grid.cells.tolist()
+
+    for i, index in enumerate(grid.indices()):
+        row, col = grid.position(index)
+        for j, direction in enumerate(DIRECTIONS):
+            d_row, d_col = STEPS[direction]
+            assert neighbours[i, j] == grid.index(row + d_row, col + d_col)
+
+            ray = [grid.flat[step] for step in grid.ray(index, direction)]
+            assert ray == walk(cells, row, col, direction)
+
+    # Border neighbours land on the padding
+    assert not grid.inside[neighbours].all()
+    assert (grid.flat[neighbours[~grid.inside[neighbours]]] == grid.fill).all()
+
+
+def test_from_text_without_mapping_keeps_bytes():
+    grid = Grid.from_text("ab\nc")
+    assert grid.cells.tolist() == [[ord("a"), ord("b")], [ord("c"), ord(" ")]]
+
+
+def test_from_text_rejects_unmapped_characters():
+    with pytest.raises(ValueError):
+        Grid.from_text("12\n3x", mapping=Grid.DIGITS)
+
+
+def test_cells_share_memory_with_the_padded_buffer():
+    grid = Grid(np.arange(6).reshape(2, 3), pad=2, fill=-1)
+    grid.cells[1, 2] = 42
+
+    assert grid.flat[grid.index(1, 2)] == 42
+    assert grid.padded.shape == (6, 7)
+    assert (grid.padded[:2] == -1).all()
@@ -0,0 +1,41 @@
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# A cold import of the runner takes around 0.1-0.25 s; leave room for slow
+# machines while still catching an eager NumPy or submodule import
+IMPORT_BUDGET = 0.75
+
+
+def fresh_import(statement):
+    """Run ``statement`` in a new interpreter; its import time and whether NumPy loaded."""
+    script = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "print(time.perf_counter() - start, 'numpy' in sys.modules)\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script], cwd=ROOT, capture_output=True, text=True, check=True
+    ).stdout.split()
+
+    return float(output[0]), output[1] == "True"
+
+
+def test_package_import_is_lazy():
+    _, numpy_loaded = fresh_import("import aoc_utils")
+    assert not numpy_loaded
+
+
+def test_runner_import_stays_within_budget():
+    elapsed, numpy_loaded = fresh_import("import aoc_utils.run")
+
+    assert not numpy_loaded
+    assert elapsed < IMPORT_BUDGET
+
+
+def test_helpers_load_numpy_on_first_use():
+    _, numpy_loaded = fresh_import("import aoc_utils; aoc_utils.ints('1 2')")
+    assert numpy_loaded
@@ -0,0 +1,64 @@
+import pytest
+
+from aoc_utils.loader import MappedInput
+
+
+def read(path):
+    with MappedInput(path) as puzzle:
+        lines = [bytes(line) for line in puzzle.lines()]
+        blocks = [bytes(block) for block in puzzle.blocks()]
+        text = puzzle.text()
+
+    return lines, blocks, text
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        b"1\n2\n\n3\n",
+        b"1\n2\n\n3",
+        b"a\nb\n\n\nc\n",
+        b"\nx\n",
+    ],
+)
+def test_matches_split(tmp_path, data):
+    path = tmp_path / "input.txt"
+    path.write_bytes(data)
+
+    lines, blocks, text = read(path)
+
+    body = data[:-1] if data.endswith(b"\n") else data
+    assert lines == (body.split(b"\n") if data else [])
+    assert blocks == (body.split(b"\n\n") if data else [])
+    assert text == data.decode()
+
+
+def test_lines_strip_carriage_returns(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_bytes(b"1\r\n2\r\n")
+
+    assert read(path)[0] == [b"1", b"2"]
+
+
+def test_crlf_blocks(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_bytes(b"1\r\n2\r\n\r\n3\r\n\r\n4\r\n")
+
+    with MappedInput(path) as puzzle:
+        assert puzzle.blank_line == b"\r\n\r\n"
+        assert puzzle.find(puzzle.blank_line) == 4
+
+    lines, blocks, _ = read(path)
+    assert lines == [b"1", b"2", b"", b"3", b"", b"4"]
+    assert blocks == [b"1\r\n2", b"3", b"4"]
+
+
+def test_views_in_a_failing_block_do_not_mask_its_error(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_bytes(b"1\n2\n")
+
+    with pytest.raises(KeyError):
+        with MappedInput(path) as puzzle:
+            view = puzzle.view()
+            raise KeyError(bytes(view))
@@ -0,0 +1,40 @@
+import time
+from pathlib import Path
+
+from aoc_utils.profiling import profile_part
+
+HERE = f"{Path(__file__).parent.name}/{Path(__file__).name}"
+
+
+def allocate_and_free(data):
+    # The peak is a temporary that is gone by the time the part returns,
+    # held for longer than the snapshot thread's polling interval
+    scratch = bytearray(8 << 20)
+    time.sleep(0.05)
+    del scratch
+    return len(data)
+
+
+def test_tracemalloc_reports_allocations_at_the_peak(tmp_path):
+    answer, path, summary = profile_part("tracemalloc", allocate_and_free, "abc", "part", out_dir=tmp_path)
+
+    assert answer == 3
+    assert summary[0].startswith("peak ")
+    assert HERE in summary[1] and float(summary[1].split()[0]) > 8 * 1024
+
+    stacks = path.read_text().splitlines()
+    heaviest = max(stacks, key=lambda line: int(line.rsplit(" ", 1)[1]))
+    assert int(heaviest.rsplit(" ", 1)[1]) >= 8 << 20
+
+    # Stacks start at the profiled part, not in the profiler or its caller
+    assert all(line.startswith(HERE) for line in stacks)
+
+
+def test_sampler_stacks_start_at_the_part(tmp_path):
+    def spin(data):
+        return sum(i * i for i in range(300_000))
+
+    _, path, summary = profile_part("sample", spin, "", "part", out_dir=tmp_path)
+
+    assert summary
+    assert all(line.startswith("spin (") for line in path.read_text().splitlines())
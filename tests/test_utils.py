@@ -0,0 +1,64 @@
+import random
+import re
+
+import numpy as np
+import pytest
+
+from aoc_utils.utils import int_rows, ints
+
+# A number with an optional sign, unless the "-" itself follows a digit
+NUMBER = re.compile(r"(?<![0-9])-?[0-9]+|[0-9]+")
+
+
+def brute_force(text):
+    return [int(number) for number in NUMBER.findall(text)]
+
+
+def random_text(rng, count):
+    separators = [" ", "\n", ",", "-", "--", "x=", ", y=-", "->"]
+    parts = []
+    for _ in range(count):
+        parts.append(rng.choice(separators))
+        parts.append(str(rng.randint(-10**12, 10**12)))
+    return "".join(parts)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "no numbers",
+        "x=-5, y=12",
+        "2-4,6-8",
+        "--7 -0 007",
+        "Sensor at x=2, y=18: closest beacon is at x=-2, y=15\n",
+    ],
+)
+def test_ints_match_regex(text):
+    assert ints(text, np.int64).tolist() == brute_force(text)
+    assert ints(text.encode()).tolist() == brute_force(text)
+
+
+def test_ints_match_regex_on_random_text():
+    text = random_text(random.Random(0), 2000)
+    assert ints(text, np.int64).tolist() == brute_force(text)
+
+
+def test_ints_default_is_an_array_of_int64():
+    values = ints("1 -2 3")
+    assert values.typecode == "q"
+    assert list(values) == [1, -2, 3]
+
+
+def test_int_rows():
+    assert int_rows("1,2,3\n4,5,6\n", 3).tolist() == [[1, 2, 3], [4, 5, 6]]
+
+    with pytest.raises(ValueError):
+        int_rows("1,2,3\n4,5\n", 3)
+
+
+def test_ints_rejects_numbers_that_would_overflow():
+    assert ints("-999999999999999999", np.int64).tolist() == [-(10**18 - 1)]
+
+    with pytest.raises(ValueError):
+        ints("1 " + "9" * 19)